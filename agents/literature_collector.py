@@ -167,7 +167,8 @@ class LiteratureCollectorAgent(ToolAgent):
     def _search_literature_keyword(self, keyword: str, n_results: int = 10) -> str:
         """关键词搜索文献"""
         try:
-            result = self.literature_storage.search_keyword(keyword, n_results=n_results)
+            # 只展示返回的条目，不需要统计全部命中数
+            result = self.literature_storage.search_keyword(keyword, n_results=n_results, count_all=False)
 
             if not result.items:
                 return f"在本地数据库中未找到包含关键词'{keyword}'的文献。"
@@ -5,11 +5,13 @@ Data Storage Tool with RAG support for dataset discovery and management
 
 import os
 import json
+import math
+import codecs
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from loguru import logger
 
 # 尝试导入向量数据库依赖
@@ -21,6 +23,12 @@ except ImportError:
     CHROMA_AVAILABLE = False
     logger.warning("ChromaDB未安装，RAG功能将不可用。请运行: pip install chromadb")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from sentence_transformers import SentenceTransformer
     EMBEDDINGS_AVAILABLE = True
@@ -36,6 +44,45 @@ except ImportError:
     logger.warning("pandas未安装，数据读取功能将受限。请运行: pip install pandas")
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码、缩进2格的JSON字节（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _encode_non_finite(numeric_summary: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
+    """
+    将统计摘要中的NaN/Inf转为字符串，保证JSON往返后不丢失
+
+    orjson会把非有限浮点数写成null，而 "NaN"/"Infinity"/"-Infinity"
+    字符串可被pydantic的float字段直接解析回原值。
+
+    Args:
+        numeric_summary: 数值列统计摘要
+
+    Returns:
+        可安全序列化的统计摘要
+    """
+    return {
+        col: {k: v if math.isfinite(v) else _NON_FINITE_NAMES[math.copysign(1, v) if math.isinf(v) else 0]
+              for k, v in stats.items()}
+        for col, stats in numeric_summary.items()
+    }
+
+
+_NON_FINITE_NAMES = {0: "NaN", 1: "Infinity", -1: "-Infinity"}
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON字节（优先使用orjson，兼容带BOM的文件）"""
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # ==================== 数据模型 ====================
 
 class StoredDataItem(BaseModel):
@@ -75,6 +122,18 @@ class StoredDataItem(BaseModel):
     tags: List[str] = Field(default_factory=list, description="自定义标签")
     notes: Optional[str] = Field(default=None, description="备注")
 
+    @field_validator("numeric_summary", mode="before")
+    @classmethod
+    def _restore_nan_stats(cls, value: Any) -> Any:
+        """兼容旧备份：orjson曾将NaN/Inf写为null（如单行数据的std），读回时还原为NaN"""
+        if isinstance(value, dict):
+            return {
+                col: {k: float("nan") if v is None else v for k, v in stats.items()}
+                if isinstance(stats, dict) else stats
+                for col, stats in value.items()
+            }
+        return value
+
 
 class DataSearchResult(BaseModel):
     """数据搜索结果"""
@@ -160,14 +219,14 @@ class DataStorageTool:
     def _load_index(self) -> Dict[str, Any]:
         """加载数据索引"""
         if self.index_file.exists():
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(self.index_file.read_bytes())
         return {"items": {}, "stats": {"total": 0, "by_type": {}, "by_domain": {}}}
 
     def _save_index(self):
-        """保存数据索引"""
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        """保存数据索引（先写临时文件再原子替换）"""
+        tmp_file = self.index_file.with_suffix(self.index_file.suffix + ".tmp")
+        tmp_file.write_bytes(_json_dumps(self.index))
+        os.replace(tmp_file, self.index_file)
 
     def _generate_id(self, item: Union[StoredDataItem, Dict]) -> str:
         """生成数据唯一ID"""
@@ -297,7 +356,8 @@ class DataStorageTool:
         self,
         item: Union[StoredDataItem, Dict[str, Any]],
         auto_extract_summary: bool = True,
-        source: str = "manual"
+        source: str = "manual",
+        defer_save: bool = False
     ) -> str:
         """
         添加数据集信息
@@ -306,6 +366,7 @@ class DataStorageTool:
             item: 数据项(Pydantic模型或字典)
             auto_extract_summary: 是否自动提取数据摘要
             source: 来源标识
+            defer_save: 是否延迟保存索引（批量导入时使用，结束后统一调用 _save_index）
 
         Returns:
             数据ID
@@ -346,8 +407,9 @@ class DataStorageTool:
 
         # 1. 保存到JSON备份
         backup_file = self.backup_dir / f"{item_id}.json"
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(validated_item.model_dump(), f, ensure_ascii=False, indent=2)
+        backup_data = validated_item.model_dump()
+        backup_data["numeric_summary"] = _encode_non_finite(backup_data["numeric_summary"])
+        backup_file.write_bytes(_json_dumps(backup_data))
 
         # 2. 更新索引
         self.index["items"][item_id] = {
@@ -373,7 +435,8 @@ class DataStorageTool:
             self.index["stats"]["by_domain"][validated_item.domain] = \
                 self.index["stats"]["by_domain"].get(validated_item.domain, 0) + 1
 
-        self._save_index()
+        if not defer_save:
+            self._save_index()
 
         # 3. 添加到向量数据库
         if self.collection is not None:
@@ -430,11 +493,15 @@ class DataStorageTool:
         ids = []
         for item in items:
             try:
-                item_id = self.add_data(item, auto_extract_summary, source)
+                item_id = self.add_data(item, auto_extract_summary, source, defer_save=True)
                 ids.append(item_id)
             except Exception as e:
                 logger.error(f"[DataStorage] 批量添加失败: {e}")
 
+        # 整批只写一次索引
+        if ids:
+            self._save_index()
+
         logger.info(f"[DataStorage] 批量添加完成: {len(ids)}/{len(items)} 个数据集")
         return ids
 
@@ -616,9 +683,7 @@ class DataStorageTool:
         """
         backup_file = self.backup_dir / f"{item_id}.json"
         if backup_file.exists():
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return StoredDataItem(**data)
+            return StoredDataItem(**_json_loads(backup_file.read_bytes()))
         return None
 
     def delete_data(self, item_id: str) -> bool:
@@ -795,7 +860,7 @@ class DataStorageTool:
                     "tags": ["自动导入", file_path.parent.name]
                 }
 
-                item_id = self.add_data(item_data, auto_extract_summary=auto_extract, source="scan")
+                item_id = self.add_data(item_data, auto_extract_summary=auto_extract, source="scan", defer_save=True)
                 stats["imported_ids"].append(item_id)
                 stats["imported"] += 1
 
@@ -803,6 +868,10 @@ class DataStorageTool:
                 logger.error(f"[DataStorage] 导入失败 {file_path}: {e}")
                 stats["errors"] += 1
 
+        # 扫描结束后只写一次索引
+        if stats["imported_ids"]:
+            self._save_index()
+
         stats["success"] = True
         logger.info(
             f"[DataStorage] 扫描完成: 总计 {stats['total_files']} 个文件, "
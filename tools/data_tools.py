@@ -6,7 +6,14 @@ Data Interaction Tools for reading, previewing and analyzing local data
 Agent在分析任务中应该积极使用这些工具来获取真实数据。
 """
 
+import os
 import json
+import heapq
+import operator
+import stat
+import shutil
+import hashlib
+import tempfile
 from typing import List, Dict, Any, Optional, Union, Callable
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -36,8 +43,291 @@ except ImportError:
     PANDAS_AVAILABLE = False
     logger.warning("pandas未安装，数据工具功能将受限。请运行: pip install pandas numpy")
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.ipc
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 超过该大小的Parquet/Arrow文件使用内存映射读取，避免先读入缓冲区再拷贝
+MMAP_THRESHOLD_BYTES = 16 << 20
+
+# 跨进程共享缓存（默认关闭，设置 ECOAGENT_SHARED_CACHE=true 启用）
+SHARED_CACHE_ENABLED = os.getenv("ECOAGENT_SHARED_CACHE", "false").lower() == "true"
+# 缓存目录按用户隔离（优先使用tmpfs），权限0700
+_CACHE_USER = str(os.getuid()) if hasattr(os, "getuid") else os.getenv("USERNAME", "user")
+SHARED_CACHE_DIR = (
+    Path("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()) / f"ecoagent_cache_{_CACHE_USER}"
+)
+# 容量上限：不超过该值，也不超过所在文件系统可用空间的一半（容器中/dev/shm通常只有64MB）
+SHARED_CACHE_MAX_BYTES = 2 << 30
+
 # 导入数据存储工具
-from tools.data_storage import DataStorageTool, get_data_storage
+from tools.data_storage import DataStorageTool, StoredDataItem, get_data_storage
+
+
+# ==================== 辅助函数 ====================
+
+# 统计与查询路径的瓶颈是内存带宽（对float64/object列的整列扫描），而非算力：
+# - 数值列：一次性对数值子表调用describe，让pandas在连续的NumPy块上完成归约；
+# - 字符串列：转为Arrow数组后用pyarrow.compute统计，直接在UTF-8缓冲区上计算，
+#   避免pandas object列逐个Python字符串处理；
+# - 记录转换：无缺失值的原生数值列直接tolist，跳过object转换和缺失值替换。
+# 不引入GPU路径：此处的数据规模不足以摊销主机与设备间的传输开销。
+
+_DESCRIBE_KEYS = ('mean', 'std', 'min', '25%', '50%', '75%', 'max')
+
+
+def _describe_to_stats(col_desc: "pd.Series") -> Dict[str, float]:
+    """将单列describe结果转换为统计字典"""
+    return {
+        'count': int(col_desc['count']),
+        **{k: float(col_desc[k]) for k in _DESCRIBE_KEYS}
+    }
+
+
+def _column_to_list(series: "pd.Series") -> List[Any]:
+    """将单列转换为Python列表（缺失值转为None）"""
+    if (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        and not pd.api.types.is_extension_array_dtype(series.dtype)
+        and not series.hasnans
+    ):
+        return series.tolist()
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _arrow_categorical_stats(series: "pd.Series") -> Optional[Dict[str, Any]]:
+    """
+    使用pyarrow.compute计算字符串列的频数统计
+
+    Args:
+        series: 字符串列
+
+    Returns:
+        统计结果；列无法转换为Arrow数组或Arrow不支持该类型的频数统计时返回None
+    """
+    try:
+        arr = pa.array(series, from_pandas=True)
+        counts_struct = pc.value_counts(arr.drop_null())
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    values = counts_struct.field('values').to_pylist()
+    counts = counts_struct.field('counts').to_pylist()
+    if not values:
+        return {'unique_count': 0, 'top_values': {}, 'most_common': None}
+
+    top = heapq.nlargest(10, range(len(values)), key=counts.__getitem__)
+    max_count = counts[top[0]]
+    try:
+        # 与pandas.mode保持一致：并列时取最小值
+        most_common = min(v for v, c in zip(values, counts) if c == max_count)
+    except TypeError:
+        # 值之间不可比较（如嵌套结构），交给pandas处理
+        return None
+    return {
+        'unique_count': len(values),
+        'top_values': {values[i]: counts[i] for i in top},
+        'most_common': str(most_common)
+    }
+
+
+def _pandas_categorical_stats(series: "pd.Series") -> Dict[str, Any]:
+    """使用pandas计算分类列的频数统计"""
+    value_counts = series.value_counts().head(10)
+    mode = series.mode()
+    return {
+        'unique_count': int(series.nunique()),
+        'top_values': value_counts.to_dict(),
+        'most_common': str(mode.iloc[0]) if len(mode) > 0 else None
+    }
+
+
+_DATASET_KEYS = ('id', 'name', 'description', 'file_path', 'row_count', 'column_count', 'domain', 'keywords')
+_get_dataset_fields = operator.attrgetter(*_DATASET_KEYS)
+
+
+def _dataset_summary(item: StoredDataItem) -> Dict[str, Any]:
+    """将数据集条目转换为搜索结果字典（列名最多保留20个）"""
+    summary = dict(zip(_DATASET_KEYS, _get_dataset_fields(item)))
+    summary["columns"] = item.columns[:20] if item.columns else []
+    return summary
+
+
+def _frame_to_records(df: "pd.DataFrame") -> List[Dict[str, Any]]:
+    """
+    将DataFrame转换为行记录列表（缺失值转为None）
+
+    先按列一次性取出Python列表，再用zip转置为行记录，
+    避免 to_dict('records') 为每个单元格单独分配字典槽位。
+
+    Args:
+        df: 数据框
+
+    Returns:
+        行记录列表
+    """
+    cols = df.columns.tolist()
+    arrays = [_column_to_list(df.iloc[:, i]) for i in range(len(cols))]
+    return [dict(zip(cols, row)) for row in zip(*arrays)]
+
+
+class _SharedFrameCache:
+    """
+    跨进程共享的DataFrame缓存
+
+    每个解析后的数据框以Arrow IPC文件形式保存在tmpfs中，文件名由
+    (绝对路径, mtime, 大小) 的哈希决定，源文件变化后自动失效。
+    同机的其他Agent进程通过内存映射直接读取，无需重新解析源文件。
+    超出容量上限时按最近访问时间淘汰（LRU）。
+
+    缓存默认关闭。目录按用户隔离且权限为0700，属主或权限不符时禁用缓存，
+    读取前再校验缓存文件的属主，避免读到其他用户放置的文件。
+
+    Arrow往返会改变部分pandas类型（如非字符串列名、datetime64精度），
+    因此写入时在schema元数据中记录原始dtype，读取时按其还原；
+    列名不全是字符串的数据框不进入共享缓存。
+    """
+
+    DTYPES_METADATA_KEY = b"ecoagent.dtypes"
+
+    def __init__(
+        self,
+        cache_dir: Path = SHARED_CACHE_DIR,
+        max_bytes: int = SHARED_CACHE_MAX_BYTES,
+        enabled: bool = SHARED_CACHE_ENABLED
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = enabled and PYARROW_AVAILABLE
+        if self.enabled:
+            try:
+                self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                self._check_private(self.cache_dir, stat.S_ISDIR)
+            except OSError as e:
+                logger.warning(f"[DataTools] 共享缓存目录不可用，已禁用: {e}")
+                self.enabled = False
+
+    @staticmethod
+    def _check_private(path: Path, is_type: Callable[[int], bool]):
+        """校验路径不是符号链接、类型正确、属于当前用户且其他用户不可访问，否则抛出OSError"""
+        st = os.lstat(path)
+        if not is_type(st.st_mode):
+            raise OSError(f"{path} 类型不符或为符号链接")
+        if hasattr(os, "getuid"):
+            if st.st_uid != os.getuid():
+                raise OSError(f"{path} 不属于当前用户")
+            if st.st_mode & 0o077:
+                raise OSError(f"{path} 权限过宽: {oct(stat.S_IMODE(st.st_mode))}")
+
+    def _budget(self, used: int) -> int:
+        """当前容量上限：max_bytes 与 (已用 + 剩余空间) 的一半取较小者"""
+        try:
+            free = shutil.disk_usage(self.cache_dir).free
+        except OSError:
+            return 0
+        return min(self.max_bytes, (used + free) // 2)
+
+    def _entry_path(self, path: Path) -> Path:
+        stat = path.stat()
+        key = f"{path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.arrow"
+
+    def get(self, path: Path) -> Optional["pd.DataFrame"]:
+        """读取缓存，未命中返回None"""
+        if not self.enabled:
+            return None
+        entry = self._entry_path(path)
+        try:
+            self._check_private(entry, stat.S_ISREG)
+            with pa.memory_map(str(entry), 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+                # 深拷贝：零拷贝转换得到的列指向只读的内存映射，调用方修改时会报错
+                df = table.to_pandas().copy()
+            df = self._restore_dtypes(df, table.schema)
+            if df is None:
+                return None
+            os.utime(entry)  # 刷新访问时间，供LRU淘汰使用
+            return df
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"[DataTools] 共享缓存读取失败: {e}")
+            return None
+
+    def put(self, path: Path, df: "pd.DataFrame"):
+        """写入缓存（先写临时文件再原子替换，避免其他进程读到半成品）"""
+        if not self.enabled:
+            return
+        if not all(isinstance(col, str) for col in df.columns):
+            # 非字符串列名经Arrow往返后会变成字符串，无法还原
+            return
+        if int(df.memory_usage(index=False).sum()) > self._budget(0):
+            # 预计超出容量上限（如容器中很小的/dev/shm），不写入
+            return
+        entry = self._entry_path(path)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df)
+            dtypes = json.dumps([str(dtype) for dtype in df.dtypes]).encode('utf-8')
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                self.DTYPES_METADATA_KEY: dtypes,
+            })
+            # 以0600创建临时文件，替换后的缓存文件仅当前用户可读
+            os.close(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+            with pa.OSFile(str(tmp), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp, entry)
+        except Exception as e:
+            logger.debug(f"[DataTools] 共享缓存写入失败: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _restore_dtypes(self, df: "pd.DataFrame", schema: "pa.Schema") -> Optional["pd.DataFrame"]:
+        """按写入时记录的dtype还原各列，无法还原时返回None（视为未命中）"""
+        raw = (schema.metadata or {}).get(self.DTYPES_METADATA_KEY)
+        if raw is None:
+            return None
+        dtypes = json.loads(raw)
+        if len(dtypes) != len(df.columns):
+            return None
+        try:
+            for i, dtype in enumerate(dtypes):
+                if str(df.dtypes.iloc[i]) != dtype:
+                    df[df.columns[i]] = df.iloc[:, i].astype(dtype)
+        except (TypeError, ValueError):
+            return None
+        return df
+
+    def _evict(self):
+        """按最近访问时间淘汰，直到总大小不超过上限"""
+        entries = []
+        for f in self.cache_dir.glob("*.arrow"):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, f))
+        total = sum(size for _, size, _ in entries)
+        budget = self._budget(total)
+        for _, size, f in sorted(entries, key=lambda e: e[0]):
+            if total <= budget:
+                break
+            f.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """清空共享缓存"""
+        if not self.enabled:
+            return
+        for f in self.cache_dir.glob("*.arrow"):
+            f.unlink(missing_ok=True)
 
 
 # ==================== 数据模型 ====================
@@ -78,7 +368,7 @@ class DataTools:
     数据交互工具集
 
     提供以下功能:
-    1. 读取数据文件 (CSV, Excel, JSON, Parquet)
+    1. 读取数据文件 (CSV, Excel, JSON, Parquet, Arrow)
     2. 数据预览 (head, tail, sample)
     3. 数据统计 (describe, value_counts)
     4. 数据查询 (filter, select)
@@ -102,6 +392,7 @@ class DataTools:
         """
         self.data_storage = data_storage or get_data_storage()
         self._cache: Dict[str, pd.DataFrame] = {}  # 简单缓存
+        self._shared_cache = _SharedFrameCache()  # 跨进程共享缓存
         logger.info("[DataTools] 数据工具初始化完成")
 
     def _read_file(self, file_path: str, use_cache: bool = True) -> pd.DataFrame:
@@ -127,6 +418,14 @@ class DataTools:
         if not path.exists():
             raise ToolException(f"文件不存在: {file_path}")
 
+        if use_cache:
+            df = self._shared_cache.get(path)
+            if df is not None:
+                logger.debug(f"[DataTools] 使用共享缓存: {file_path}")
+                if len(df) < 100000:
+                    self._cache[file_path] = df
+                return df
+
         logger.info(f"[DataTools] 读取数据文件: {file_path}")
 
         try:
@@ -137,14 +436,20 @@ class DataTools:
                 df = pd.read_excel(file_path)
             elif suffix == '.json':
                 df = pd.read_json(file_path)
+            elif suffix in ['.parquet', '.arrow'] and self._should_memory_map(path):
+                df = self._read_memory_mapped(path)
             elif suffix == '.parquet':
                 df = pd.read_parquet(file_path)
+            elif suffix == '.arrow':
+                df = pd.read_feather(file_path)
             else:
                 raise ToolException(f"不支持的文件格式: {suffix}")
 
             # 缓存（限制大小）
             if use_cache and len(df) < 100000:  # 只缓存小于10万行的数据
                 self._cache[file_path] = df
+            if use_cache:
+                self._shared_cache.put(path, df)
 
             logger.info(f"[DataTools] 成功读取数据: {len(df)}行 x {len(df.columns)}列")
             return df
@@ -153,6 +458,31 @@ class DataTools:
             logger.error(f"[DataTools] 读取数据失败: {e}")
             raise ToolException(f"读取数据失败: {e}")
 
+    @staticmethod
+    def _should_memory_map(path: Path) -> bool:
+        """判断是否使用内存映射读取（需要pyarrow，且文件足够大）"""
+        return PYARROW_AVAILABLE and path.stat().st_size > MMAP_THRESHOLD_BYTES
+
+    @staticmethod
+    def _read_memory_mapped(path: Path) -> pd.DataFrame:
+        """
+        通过 pyarrow.memory_map 读取Parquet/Arrow文件
+
+        由内核按需映射页面，省去一次用户态拷贝和目标缓冲区清零。
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            DataFrame
+        """
+        with pa.memory_map(str(path), 'r') as source:
+            if path.suffix.lower() == '.parquet':
+                table = pq.read_table(source, use_threads=True)
+            else:
+                table = pa.ipc.open_file(source).read_all()
+            return table.to_pandas()
+
     def search_datasets(
         self,
         query: str,
@@ -186,19 +516,7 @@ class DataTools:
             result = self.data_storage.search_hybrid(query, n_results)
 
         # 转换为简单字典列表
-        datasets = []
-        for item in result.items:
-            datasets.append({
-                "id": item.id,
-                "name": item.name,
-                "description": item.description,
-                "file_path": item.file_path,
-                "row_count": item.row_count,
-                "column_count": item.column_count,
-                "columns": item.columns[:20] if item.columns else [],  # 限制列数
-                "domain": item.domain,
-                "keywords": item.keywords
-            })
+        datasets = list(map(_dataset_summary, result.items))
 
         logger.info(f"[DataTools] 找到 {len(datasets)} 个匹配数据集")
         return datasets
@@ -242,7 +560,7 @@ class DataTools:
             preview_df = df.head(n_rows)
 
         # 转换为可序列化的格式
-        head_data = preview_df.replace({np.nan: None}).to_dict('records')
+        head_data = _frame_to_records(preview_df)
 
         # 计算内存使用
         memory = df.memory_usage(deep=True).sum()
@@ -295,43 +613,45 @@ class DataTools:
         if columns:
             df = df[columns]
 
-        # 数值列统计
+        # 数值列统计：一次describe覆盖全部数值列，而不是逐列调用
         numeric_cols = df.select_dtypes(include=['number']).columns
         numeric_stats = {}
-        for col in numeric_cols:
+        if len(numeric_cols) > 0:
             try:
-                desc = df[col].describe()
-                numeric_stats[col] = {
-                    'count': int(desc['count']),
-                    'mean': float(desc['mean']),
-                    'std': float(desc['std']),
-                    'min': float(desc['min']),
-                    '25%': float(desc['25%']),
-                    '50%': float(desc['50%']),
-                    '75%': float(desc['75%']),
-                    'max': float(desc['max'])
-                }
+                desc = df[numeric_cols].describe()
+                for col in numeric_cols:
+                    numeric_stats[col] = _describe_to_stats(desc[col])
             except Exception:
-                pass
-
-        # 分类列统计
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+                # 整体统计失败时逐列重试，单个异常列不影响其他列
+                numeric_stats = {}
+                for col in numeric_cols:
+                    try:
+                        numeric_stats[col] = _describe_to_stats(df[col].describe())
+                    except Exception:
+                        pass
+
+        # 分类列统计：字符串列优先走Arrow计算路径，失败时退回pandas
+        categorical_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
         categorical_stats = {}
         for col in categorical_cols:
             try:
-                value_counts = df[col].value_counts().head(10)
-                categorical_stats[col] = {
-                    'unique_count': int(df[col].nunique()),
-                    'top_values': value_counts.to_dict(),
-                    'most_common': str(df[col].mode().iloc[0]) if len(df[col].mode()) > 0 else None
-                }
+                series = df[col]
+                stats = None
+                if PYARROW_AVAILABLE and not isinstance(series.dtype, pd.CategoricalDtype):
+                    try:
+                        stats = _arrow_categorical_stats(series)
+                    except Exception as e:
+                        # Arrow计算失败时该列回退到pandas，不丢弃统计
+                        logger.debug(f"列 {col} 的Arrow频数统计失败，回退到pandas: {e}")
+                categorical_stats[col] = stats or _pandas_categorical_stats(series)
             except Exception:
                 pass
 
-        # 缺失值统计
+        # 缺失值统计：一次isna扫描得到所有列的缺失数
         missing_stats = {}
+        missing_counts = df.isna().sum()
         for col in df.columns:
-            missing_count = int(df[col].isna().sum())
+            missing_count = int(missing_counts[col])
             missing_stats[col] = {
                 'missing_count': missing_count,
                 'missing_ratio': round(missing_count / len(df), 4) if len(df) > 0 else 0,
@@ -420,7 +740,7 @@ class DataTools:
         df = df.iloc[offset:offset + limit]
 
         # 转换数据
-        data = df.replace({np.nan: None}).to_dict('records')
+        data = _frame_to_records(df)
 
         result = DataQueryResult(
             file_path=file_path,
@@ -522,9 +842,16 @@ class DataTools:
         logger.info(f"[DataTools] 导出完成: {len(df)}行 -> {output_path}")
         return output_path
 
-    def clear_cache(self):
-        """清除数据缓存"""
+    def clear_cache(self, shared: bool = False):
+        """
+        清除数据缓存
+
+        Args:
+            shared: 是否同时清空跨进程共享缓存
+        """
         self._cache.clear()
+        if shared:
+            self._shared_cache.clear()
         logger.info("[DataTools] 缓存已清除")
 
 
@@ -649,9 +976,16 @@ def create_data_tools(data_storage: Optional[DataStorageTool] = None) -> List[Ba
 
 # ==================== 便捷函数 ====================
 
+# 全局实例
+_data_tools_instance: Optional[DataTools] = None
+
+
 def get_data_tools(data_storage: Optional[DataStorageTool] = None) -> DataTools:
     """
-    获取数据工具实例
+    获取数据工具单例
+
+    同一进程内的Agent共享同一个实例及其数据缓存；
+    传入不同的数据存储工具时重新创建实例。
 
     Args:
         data_storage: 数据存储工具实例
@@ -659,7 +993,12 @@ def get_data_tools(data_storage: Optional[DataStorageTool] = None) -> DataTools:
     Returns:
         数据工具实例
     """
-    return DataTools(data_storage)
+    global _data_tools_instance
+    if _data_tools_instance is None or (
+        data_storage is not None and _data_tools_instance.data_storage is not data_storage
+    ):
+        _data_tools_instance = DataTools(data_storage)
+    return _data_tools_instance
 
 
 def get_langchain_data_tools(data_storage: Optional[DataStorageTool] = None) -> List[BaseTool]:
@@ -4,10 +4,23 @@ Literature Storage Tool with RAG support and original format backup
 """
 
 import os
+import re
+import csv
 import json
+import codecs
+import time
+import queue
+import atexit
+import sqlite3
+import functools
+import bisect
 import hashlib
+import weakref
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 from pydantic import BaseModel, Field
 from loguru import logger
@@ -22,12 +35,367 @@ except ImportError:
     logger.warning("ChromaDB未安装，RAG功能将不可用。请运行: pip install chromadb")
 
 try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    import torch
     from sentence_transformers import SentenceTransformer
     EMBEDDINGS_AVAILABLE = True
 except ImportError:
     EMBEDDINGS_AVAILABLE = False
     logger.warning("sentence-transformers未安装，将使用ChromaDB默认嵌入。请运行: pip install sentence-transformers")
 
+# 可选：pyarrow的多线程CSV读取器，按块流式解析
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 可选：ONNX Runtime INT8量化推理（CPU），设置环境变量 ECOAGENT_QUANTIZE=1 启用
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """序列化为UTF-8编码的JSON字节（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON字节（优先使用orjson，兼容带BOM的文件）"""
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """一次写入临时文件后原子替换，崩溃时不会留下写了一半的文件"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _flush_on_exit(storage_ref: "weakref.ref"):
+    """进程退出时提交仍未写入的修改（实例已被回收时跳过）"""
+    storage = storage_ref()
+    if storage is not None:
+        storage.flush()
+
+
+def _select_device() -> str:
+    """选择嵌入模型的计算设备: cuda > mps > cpu"""
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _quantize_embedding(vector: "np.ndarray", storage_dtype: str) -> "np.ndarray":
+    """
+    按存储精度压缩嵌入向量
+
+    int8 使用对称标量量化（要求向量已归一化，分量在[-1, 1]内）。
+
+    Args:
+        vector: float32嵌入向量
+        storage_dtype: float32 / float16 / int8
+
+    Returns:
+        压缩后的向量
+    """
+    if storage_dtype == "int8":
+        return np.clip(np.round(vector * 127), -127, 127).astype(np.int8)
+    if storage_dtype == "float16":
+        return vector.astype(np.float16)
+    return vector.astype(np.float32)
+
+
+def _dequantize_embedding(stored: "np.ndarray") -> "np.ndarray":
+    """将压缩存储的嵌入向量还原为float32（根据数组自身的dtype判断）"""
+    if stored.dtype == np.int8:
+        return stored.astype(np.float32) / 127
+    return stored.astype(np.float32)
+
+
+def _extract_pdf_preview(pdf_file: str) -> Optional[str]:
+    """
+    读取PDF第一页文本作为摘要预览（模块级函数，可在子进程中执行）
+
+    Args:
+        pdf_file: PDF文件路径
+
+    Returns:
+        前 PDF_PREVIEW_CHARS 个字符；无法提取时返回None
+    """
+    import PyPDF2
+
+    try:
+        with open(pdf_file, 'rb') as f:
+            reader = PyPDF2.PdfReader(f, strict=False)
+            if len(reader.pages) > 0:
+                # 只读取第一页
+                first_page = reader.pages[0].extract_text()
+                if first_page:
+                    return first_page[:PDF_PREVIEW_CHARS].strip()
+    except Exception as e:
+        logger.debug(f"提取PDF文本失败 {Path(pdf_file).name}: {e}")
+    return None
+
+
+_torch_threads_configured = False
+
+
+def _configure_torch_threads():
+    """CPU推理时让torch使用全部逻辑核（每个进程只设置一次）"""
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    cpu_count = os.cpu_count()
+    if cpu_count and torch.get_num_threads() < cpu_count:
+        torch.set_num_threads(cpu_count)
+    _torch_threads_configured = True
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str, device: str) -> "SentenceTransformer":
+    """
+    加载嵌入模型（进程内按模型名和设备共享同一实例，避免重复加载）
+
+    Args:
+        model_name: 模型名称
+        device: 推理设备
+
+    Returns:
+        推理模式下的 SentenceTransformer 实例
+    """
+    model = SentenceTransformer(model_name, device=device)
+    if device == "cuda":
+        # GPU上使用fp16推理，显存占用和带宽减半
+        model.half()
+    return model.eval()
+
+
+class _QuantizedEmbeddingModel:
+    """
+    ONNX Runtime动态INT8量化的嵌入模型（CPU推理）
+
+    首次使用时导出ONNX模型并做动态量化，结果缓存在本地目录。
+    提供与 SentenceTransformer.encode 兼容的接口：分词 -> ONNX推理 -> 平均池化，
+    因此只适用于平均池化的sentence-transformers模型（如默认的MiniLM）。
+    """
+
+    QUANTIZED_FILE = "model_quantized.onnx"
+
+    def __init__(self, model_name: str, cache_dir: Path, max_seq_length: int = 128):
+        """
+        Args:
+            model_name: 模型名称（省略组织名时默认为 sentence-transformers/）
+            cache_dir: 量化模型缓存目录
+            max_seq_length: 最大序列长度
+        """
+        model_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        if not (cache_dir / self.QUANTIZED_FILE).exists():
+            logger.info(f"导出并量化嵌入模型: {model_id} -> {cache_dir}")
+            export_dir = cache_dir / "fp32"
+            ORTModelForFeatureExtraction.from_pretrained(model_id, export=True).save_pretrained(export_dir)
+            quantizer = ORTQuantizer.from_pretrained(export_dir)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=cache_dir, quantization_config=qconfig)
+            AutoTokenizer.from_pretrained(model_id).save_pretrained(cache_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(str(cache_dir))
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            str(cache_dir), file_name=self.QUANTIZED_FILE
+        )
+        self.max_seq_length = max_seq_length
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = False,
+        **kwargs
+    ) -> "np.ndarray":
+        """编码文本，返回值形状与 SentenceTransformer.encode 一致"""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        outputs = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**encoded).last_hidden_state
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            outputs.append(pooled.astype(np.float32))
+
+        embeddings = np.concatenate(outputs) if outputs else np.zeros((0, 0), dtype=np.float32)
+        if normalize_embeddings and embeddings.size:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+
+# 关键词搜索的默认字段（FTS5全文索引覆盖这些字段）
+KEYWORD_SEARCH_FIELDS = ("title", "authors", "keywords", "abstract", "core_conclusion")
+
+# trigram分词器按3字符切分，更短的关键词改用内存文本做子串匹配
+FTS_MIN_QUERY_LENGTH = 3
+
+# 内存文本中各字段的分隔符，避免关键词跨字段匹配
+SEARCH_BLOB_SEPARATOR = " \x1f "
+
+# 新建集合时的HNSW参数：M越大、ef越大召回率越高，但建索引/查询更慢、占用内存更多。
+# 文献库通常在 10^3-10^5 篇之间，以下默认值偏向召回率；语料更大时可调低 search_ef 换取延迟。
+HNSW_M = 32
+HNSW_CONSTRUCTION_EF = 200
+HNSW_SEARCH_EF = 100
+
+# 单次 collection.add 的默认文献数（ChromaDB建议每批50-250条），以及嵌入模型的前向批大小
+CHROMA_BATCH_SIZE = 200
+EMBEDDING_BATCH_SIZE = 64
+
+# 异步写入向量库：队列容量、后台线程单批最大文献数、凑批等待时间（秒）
+ASYNC_QUEUE_SIZE = 1024
+ASYNC_BATCH_SIZE = 256
+ASYNC_BATCH_WINDOW = 0.1
+
+# 内存中缓存的已解析文献数量上限
+ITEM_CACHE_SIZE = 8192
+
+# 从文件名/标题中提取作者和年份的正则（模块级预编译，导入时逐行复用）
+_CHINESE_AUTHOR_RE = re.compile(r'^[\u4e00-\u9fa5]{2,4}(等)?$')
+_ENGLISH_AUTHOR_RE = re.compile(r'^[A-Za-z\s\.\-]+$')
+_BRACKET_YEAR_RE = re.compile(r'[（\(](\d{4})[-—～]?(\d{4})?[）\)]')
+_YEAR_SUFFIX_RE = re.compile(r'(\d{4})年')
+_STANDALONE_YEAR_RE = re.compile(r'\b(20[0-3]\d)\b')
+_TITLE_YEAR_RE = re.compile(r'[（\(]\d{4}[-—～]?\d{0,4}[）\)]')
+
+# pyarrow流式读取CSV时每块的字节数
+CSV_BLOCK_SIZE = 64 << 20
+
+# PDF导入时摘要预览的字符数
+PDF_PREVIEW_CHARS = 500
+
+# 超过该大小的PDF不提取摘要预览（解析大文件的交叉引用表代价高，首页文本不值得）
+PDF_PREVIEW_MAX_BYTES = 20 << 20
+
+# 嵌入缓存支持的存储精度（float16/int8 分别将磁盘占用减为 1/2 和 1/4）
+EMBEDDING_STORAGE_DTYPES = ("float32", "float16", "int8")
+
+# 嵌入缓存每个分片文件的最大行数（每次批量编码的结果写入一个或多个分片）
+EMBEDDING_SHARD_ROWS = 4096
+
+# 查询嵌入的LRU缓存容量，以及参与缓存的最长查询（更长的文本不缓存以限制内存）
+QUERY_EMBEDDING_CACHE_SIZE = 512
+QUERY_EMBEDDING_CACHE_MAX_CHARS = 2048
+
+# 混合搜索倒数排名融合(RRF)的平滑常数
+RRF_K = 60
+
+# 参与生成文献ID的字段，以及写入嵌入文档文本的字段（与 _create_document_text 保持一致）
+_ID_FIELDS = frozenset({"title", "authors", "year"})
+_EMBED_FIELDS = frozenset({
+    "title", "authors", "year", "journal", "abstract", "keywords", "core_conclusion",
+    "theoretical_mechanism", "variable_x_definition", "variable_y_definition",
+    "identification_strategy",
+})
+
+# 单条SQL语句中IN (...)的最大参数个数
+SQLITE_MAX_VARIABLES = 500
+
+# list_all 可直接在SQLite中排序的字段
+SORTABLE_COLUMNS = ("id", "title", "authors", "year", "journal", "added_at", "source")
+
+# 文献索引表；json列保存校验后的完整文献，检索时不再读取备份文件
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    pk INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT,
+    authors TEXT,
+    year INTEGER,
+    journal TEXT,
+    added_at TEXT,
+    source TEXT,
+    tags TEXT,
+    abstract TEXT,
+    core_conclusion TEXT,
+    keywords TEXT,
+    json BLOB NOT NULL
+);
+-- list_all 的常用排序字段和统计分组字段；索引项按(字段, pk)有序，ORDER BY ... LIMIT 无需排序
+CREATE INDEX IF NOT EXISTS items_added_at ON items(added_at);
+CREATE INDEX IF NOT EXISTS items_year ON items(year);
+CREATE INDEX IF NOT EXISTS items_journal ON items(journal);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 外部内容FTS5表由触发器与items保持同步
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, authors, abstract, core_conclusion, keywords,
+    content='items', content_rowid='pk', tokenize='{tokenizer}'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts(rowid, title, authors, abstract, core_conclusion, keywords)
+    VALUES (new.pk, new.title, new.authors, new.abstract, new.core_conclusion, new.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, title, authors, abstract, core_conclusion, keywords)
+    VALUES ('delete', old.pk, old.title, old.authors, old.abstract, old.core_conclusion, old.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, title, authors, abstract, core_conclusion, keywords)
+    VALUES ('delete', old.pk, old.title, old.authors, old.abstract, old.core_conclusion, old.keywords);
+    INSERT INTO items_fts(rowid, title, authors, abstract, core_conclusion, keywords)
+    VALUES (new.pk, new.title, new.authors, new.abstract, new.core_conclusion, new.keywords);
+END;
+"""
+
+_UPSERT_SQL = """
+INSERT INTO items (id, title, authors, year, journal, added_at, source, tags,
+                   abstract, core_conclusion, keywords, json)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title, authors = excluded.authors, year = excluded.year,
+    journal = excluded.journal, added_at = excluded.added_at, source = excluded.source,
+    tags = excluded.tags, abstract = excluded.abstract,
+    core_conclusion = excluded.core_conclusion, keywords = excluded.keywords,
+    json = excluded.json
+"""
+
 
 # ==================== 数据模型 ====================
 
@@ -79,7 +447,7 @@ class LiteratureStorageTool:
     文献存储与检索工具
 
     功能:
-    1. 存储文献到向量数据库(RAG)和JSON备份
+    1. 存储文献到向量数据库(RAG)和SQLite（可选逐篇JSON备份）
     2. 语义搜索(基于embedding相似度)
     3. 关键词搜索
     4. 混合搜索
@@ -91,7 +459,13 @@ class LiteratureStorageTool:
         self,
         storage_dir: str = "data/literature",
         collection_name: str = "research_literature",
-        embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
+        embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2",
+        hnsw_m: int = HNSW_M,
+        hnsw_construction_ef: int = HNSW_CONSTRUCTION_EF,
+        hnsw_search_ef: int = HNSW_SEARCH_EF,
+        async_writes: bool = False,
+        storage_dtype: str = "float32",
+        json_backups: bool = False
     ):
         """
         初始化文献存储工具
@@ -100,6 +474,17 @@ class LiteratureStorageTool:
             storage_dir: 存储目录
             collection_name: ChromaDB集合名称
             embedding_model: 嵌入模型名称(支持中英文)
+            hnsw_m: HNSW每个节点的连接数（越大召回率越高、内存越大）
+            hnsw_construction_ef: 建索引时的候选队列长度（越大索引质量越高、写入越慢）
+            hnsw_search_ef: 查询时的候选队列长度（越大召回率越高、查询越慢）
+            async_writes: 是否在后台线程中嵌入并写入向量库（添加文献只等待索引写入，
+                语义搜索和 flush() 前会等待队列清空）
+            storage_dtype: 文档嵌入缓存的存储精度（float32 / float16 / int8）。
+                写入向量库的是还原后的float32，缓存命中和重新编码得到的向量一致
+            json_backups: 是否额外为每篇文献写一个 backup/<id>.json。
+                完整的文献JSON已保存在 literature.sqlite 的 json 列中，默认不再逐篇写文件
+
+        HNSW参数只在新建集合时生效，已有集合沿用创建时的设置。
         """
         self.storage_dir = Path(storage_dir)
         self.backup_dir = self.storage_dir / "backup"
@@ -107,18 +492,34 @@ class LiteratureStorageTool:
         self.embedding_model_name = embedding_model
 
         # 创建目录
+        self.json_backups = json_backups
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        if json_backups:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         # 初始化嵌入模型
         self.embedding_model = None
+        self.embedding_device = "cpu"
         if EMBEDDINGS_AVAILABLE:
             try:
-                self.embedding_model = SentenceTransformer(embedding_model)
-                logger.info(f"嵌入模型加载成功: {embedding_model}")
+                self.embedding_device = _select_device()
+                if self.embedding_device == "cpu":
+                    _configure_torch_threads()
+                if self.embedding_device == "cpu" and self._use_quantized_model():
+                    self.embedding_model = self._load_quantized_model(embedding_model)
+                if self.embedding_model is None:
+                    self.embedding_model = _get_model(embedding_model, self.embedding_device)
+                logger.info(f"嵌入模型加载成功: {embedding_model} (设备: {self.embedding_device})")
             except Exception as e:
                 logger.warning(f"嵌入模型加载失败: {e}")
 
+        self._query_texts_warned = False
+
+        # 重复查询直接复用嵌入，不再做前向计算（每个实例独立缓存）
+        self._cached_query_embedding = functools.lru_cache(
+            maxsize=QUERY_EMBEDDING_CACHE_SIZE
+        )(self._encode_query)
+
         # 初始化ChromaDB
         self.chroma_client = None
         self.collection = None
@@ -127,29 +528,369 @@ class LiteratureStorageTool:
                 self.chroma_client = chromadb.PersistentClient(
                     path=str(self.storage_dir / "chroma_db")
                 )
-                self.collection = self.chroma_client.get_or_create_collection(
-                    name=collection_name,
-                    metadata={"description": "Research literature collection for RAG"}
-                )
+                try:
+                    # 已有集合的距离度量不可更改，直接沿用
+                    self.collection = self.chroma_client.get_collection(name=collection_name)
+                except Exception:
+                    # 本地模型输出归一化向量时用内积，相似度即一次点积；
+                    # 否则由ChromaDB默认嵌入函数编码，使用cosine
+                    space = "ip" if self.embedding_model is not None else "cosine"
+                    self.collection = self.chroma_client.create_collection(
+                        name=collection_name,
+                        metadata={
+                            "description": "Research literature collection for RAG",
+                            "hnsw:space": space,
+                            "hnsw:M": hnsw_m,
+                            "hnsw:construction_ef": hnsw_construction_ef,
+                            "hnsw:search_ef": hnsw_search_ef
+                        }
+                    )
                 logger.info(f"ChromaDB初始化成功，集合: {collection_name}")
             except Exception as e:
                 logger.error(f"ChromaDB初始化失败: {e}")
 
-        # 加载现有备份索引
-        self.index_file = self.storage_dir / "literature_index.json"
-        self.index = self._load_index()
+        # cosine/ip 距离下归一化嵌入，ChromaDB可直接用点积计算；l2 集合保持原始向量以免改变排序
+        space = (getattr(self.collection, "metadata", None) or {}).get("hnsw:space", "l2")
+        self.normalize_embeddings = space in ("cosine", "ip")
+
+        # 按文档文本哈希持久化的嵌入缓存（按模型、是否使用INT8量化模型及是否归一化区分，
+        # 量化模型的输出与原始模型存在误差，两者的缓存不能混用）
+        cache_name = embedding_model.replace("/", "__")
+        if isinstance(self.embedding_model, _QuantizedEmbeddingModel):
+            cache_name += "__onnx_int8"
+        if self.normalize_embeddings:
+            cache_name += "__normalized"
+        self.embedding_cache_dir = self.storage_dir / "embeddings" / cache_name
+        # 缓存键 -> (分片文件, 行号)，读取时按需扫描目录中尚未索引的分片
+        self._embedding_index: Dict[str, Tuple[Path, int]] = {}
+        self._embedding_shards: set = set()
+        self._embedding_lock = threading.Lock()
+
+        if storage_dtype not in EMBEDDING_STORAGE_DTYPES:
+            raise ValueError(f"不支持的嵌入存储精度: {storage_dtype}，可选: {EMBEDDING_STORAGE_DTYPES}")
+        if storage_dtype == "int8" and not self.normalize_embeddings:
+            # 未归一化的向量超出int8量化范围
+            logger.warning("当前集合不使用cosine/ip距离，嵌入缓存改用float16存储")
+            storage_dtype = "float16"
+        self.storage_dtype = storage_dtype
+
+        # 已解析文献的LRU缓存，避免重复读取和解析JSON备份
+        self._item_cache: "OrderedDict[str, StoredLiteratureItem]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # 加载SQLite索引（旧版JSON索引的备份文件会在首次启动时迁移）
+        self.db_file = self.storage_dir / "literature.sqlite"
+        self._db_lock = threading.RLock()
+        self._fts_trigram = False
+        self._id_scheme = "md5"
+        self._db = self._load_index()
+        self._dirty = False  # 索引是否有未提交的修改
+
+        # 短关键词搜索用的内存文本: 文献ID -> casefold后的拼接文本（首次使用时构建）
+        self._search_blob: Optional[Dict[str, str]] = None
+        # 由内存文本拼接成的整段语料: (语料, 各文献起始偏移, 文献ID)，文本变化后重建
+        self._search_corpus: Optional[Tuple[str, List[int], List[str]]] = None
+
+        # 向量库的后台写入队列（仅 async_writes=True 时启用）
+        self._write_queue: Optional[queue.Queue] = None
+        if async_writes and self.collection is not None:
+            self._write_queue = queue.Queue(maxsize=ASYNC_QUEUE_SIZE)
+            threading.Thread(
+                target=self._vector_write_worker,
+                name="literature-vector-writer",
+                daemon=True
+            ).start()
+
+        # 退出前提交 defer_save 留下的未提交修改和后台队列；用弱引用避免阻止实例回收
+        atexit.register(_flush_on_exit, weakref.ref(self))
+
+    def _load_index(self) -> sqlite3.Connection:
+        """打开（必要时创建并迁移）SQLite文献索引"""
+        conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        # WAL + NORMAL：批量写入时每次提交不再整库fsync，崩溃时最多丢失最近的提交
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+
+        # 优先使用trigram分词器（支持中文子串匹配），旧版SQLite回退到unicode61
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+        ).fetchone()
+        if row is None:
+            try:
+                conn.executescript(_FTS_SCHEMA.format(tokenizer="trigram"))
+            except sqlite3.OperationalError:
+                conn.executescript(_FTS_SCHEMA.format(tokenizer="unicode61"))
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+            ).fetchone()
+        self._fts_trigram = "trigram" in row[0]
+
+        if conn.execute("SELECT 1 FROM items LIMIT 1").fetchone() is None:
+            self._migrate_backups(conn)
+
+        # 文献ID的哈希方案：新库使用BLAKE2b，已有数据的库保持MD5，保证重复导入时ID一致
+        row = conn.execute("SELECT value FROM meta WHERE key = 'id_scheme'").fetchone()
+        if row is None:
+            has_items = conn.execute("SELECT 1 FROM items LIMIT 1").fetchone() is not None
+            scheme = "md5" if has_items else "blake2b"
+            with conn:
+                conn.execute("INSERT INTO meta (key, value) VALUES ('id_scheme', ?)", (scheme,))
+            row = (scheme,)
+        self._id_scheme = row[0]
+        return conn
+
+    def _migrate_backups(self, conn: sqlite3.Connection):
+        """将旧版JSON索引对应的备份文件导入SQLite（仅在索引为空时执行一次）"""
+        rows = []
+        for backup_file in self.backup_dir.glob("*.json"):
+            try:
+                item = StoredLiteratureItem(**_json_loads(backup_file.read_bytes()))
+                rows.append(self._item_row(item))
+            except Exception as e:
+                logger.warning(f"迁移备份失败 {backup_file.name}: {e}")
 
-    def _load_index(self) -> Dict[str, Any]:
-        """加载文献索引"""
-        if self.index_file.exists():
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {"items": {}, "stats": {"total": 0, "by_year": {}, "by_journal": {}}}
+        if rows:
+            with conn:
+                conn.executemany(_UPSERT_SQL, rows)
+            logger.info(f"已将 {len(rows)} 篇文献迁移到SQLite索引: {self.db_file}")
 
     def _save_index(self):
-        """保存文献索引"""
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        """提交索引事务"""
+        with self._db_lock:
+            self._db.commit()
+            self._dirty = False
+
+    def flush(self):
+        """将延迟的索引修改写入磁盘，并等待向量库的后台写入完成"""
+        if self._dirty:
+            self._save_index()
+        self._wait_vector_writes()
+
+    def _wait_vector_writes(self):
+        """阻塞直到后台写入队列清空（同步模式下直接返回）"""
+        if self._write_queue is not None:
+            self._write_queue.join()
+
+    def _vector_write_worker(self):
+        """后台线程：在 ASYNC_BATCH_WINDOW 内凑满至多 ASYNC_BATCH_SIZE 篇文献后一次性写入"""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + ASYNC_BATCH_WINDOW
+            while len(batch) < ASYNC_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_vector_batch(batch)
+            except Exception as e:
+                logger.error(f"后台写入向量数据库失败: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    def _quantized_model_dir(self, model_name: str) -> Path:
+        """量化模型缓存目录（与chroma_db同级）"""
+        return self.storage_dir / "onnx_int8" / model_name.replace("/", "__")
+
+    def _use_quantized_model(self) -> bool:
+        """是否使用INT8量化模型：需要optimum，且设置了ECOAGENT_QUANTIZE=1或已有量化缓存"""
+        if not ONNX_AVAILABLE:
+            return False
+        if os.environ.get("ECOAGENT_QUANTIZE") == "1":
+            return True
+        cache_file = self._quantized_model_dir(self.embedding_model_name) / _QuantizedEmbeddingModel.QUANTIZED_FILE
+        return cache_file.exists()
+
+    def _load_quantized_model(self, model_name: str) -> Optional[_QuantizedEmbeddingModel]:
+        """加载（必要时导出）INT8量化模型，失败时返回None以回退到SentenceTransformer"""
+        try:
+            model = _QuantizedEmbeddingModel(model_name, self._quantized_model_dir(model_name))
+            logger.info(f"使用ONNX INT8量化嵌入模型: {model_name}")
+            return model
+        except Exception as e:
+            logger.warning(f"INT8量化模型加载失败，使用原始模型: {e}")
+            return None
+
+    def _item_row(self, item: StoredLiteratureItem, data: Optional[Dict[str, Any]] = None) -> tuple:
+        """
+        将文献转换为 items 表的一行（列顺序与 _UPSERT_SQL 一致）
+
+        Args:
+            item: 文献项
+            data: 已有的 item.model_dump() 结果，传入时不再重复导出
+        """
+        if data is None:
+            data = item.model_dump()
+        return (
+            item.id,
+            item.title,
+            item.authors,
+            item.year,
+            item.journal,
+            item.added_at,
+            item.source,
+            _json_dumps(item.tags, indent=False).decode(),
+            item.abstract,
+            item.core_conclusion,
+            # 用不可见分隔符拼接，避免关键词跨条目匹配
+            "\x1f".join(item.keywords),
+            _json_dumps(data, indent=False),
+        )
+
+    def _load_items(self, item_ids: List[str]) -> List[StoredLiteratureItem]:
+        """
+        批量加载文献（保持输入顺序，跳过不存在的条目）
+
+        缓存未命中的ID按 SQLITE_MAX_VARIABLES 分批用一条 IN 查询读取。
+
+        Args:
+            item_ids: 文献ID列表
+
+        Returns:
+            文献列表
+        """
+        found: Dict[str, StoredLiteratureItem] = {}
+        with self._cache_lock:
+            for item_id in item_ids:
+                cached = self._item_cache.get(item_id)
+                if cached is not None:
+                    self._item_cache.move_to_end(item_id)
+                    found[item_id] = cached
+        missing = [item_id for item_id in dict.fromkeys(item_ids) if item_id not in found]
+
+        for start in range(0, len(missing), SQLITE_MAX_VARIABLES):
+            chunk = missing[start:start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            with self._db_lock:
+                rows = self._db.execute(
+                    f"SELECT json FROM items WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+            for (data,) in rows:
+                item = StoredLiteratureItem.model_construct(**_json_loads(data))
+                found[item.id] = item
+                self._cache_item(item)
+
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    def _scan_items(self) -> List[StoredLiteratureItem]:
+        """
+        按添加顺序读取全部文献（全表扫描用）
+
+        已缓存的条目直接复用，其余条目只解析不放入LRU缓存，
+        避免一次扫描把热点文献全部挤出缓存。
+
+        Returns:
+            文献列表
+        """
+        with self._db_lock:
+            rows = self._db.execute("SELECT id, json FROM items ORDER BY pk").fetchall()
+        with self._cache_lock:
+            cached = {item_id: self._item_cache.get(item_id) for item_id, _ in rows}
+
+        return [
+            cached[item_id] or StoredLiteratureItem.model_construct(**_json_loads(data))
+            for item_id, data in rows
+        ]
+
+    def _get_search_blob(self) -> Dict[str, str]:
+        """返回短关键词搜索用的内存文本，首次调用时从SQLite的索引列构建"""
+        if self._search_blob is None:
+            with self._db_lock:
+                rows = self._db.execute(
+                    "SELECT id, title, authors, keywords, abstract, core_conclusion "
+                    "FROM items ORDER BY pk"
+                ).fetchall()
+            self._search_blob = {
+                row[0]: SEARCH_BLOB_SEPARATOR.join(filter(None, row[1:])).casefold()
+                for row in rows
+            }
+        return self._search_blob
+
+    def _get_search_corpus(self) -> Tuple[str, List[int], List[str]]:
+        """将全部内存文本用\\x00拼接为一个字符串，记录每篇文献的起始偏移"""
+        if self._search_corpus is None:
+            blobs = self._get_search_blob()
+            starts = []
+            offset = 0
+            for blob in blobs.values():
+                starts.append(offset)
+                offset += len(blob) + 1
+            self._search_corpus = ("\x00".join(blobs.values()), starts, list(blobs))
+        return self._search_corpus
+
+    def _blob_match(self, keyword_folded: str, limit: Optional[int] = None) -> List[str]:
+        """
+        在整段语料上用 str.find 查找关键词，按偏移二分定位所属文献
+
+        每次命中后直接跳到下一篇文献的起始位置继续查找，
+        整个查询是若干次C层面的子串扫描，没有逐篇的Python循环。
+
+        Args:
+            keyword_folded: casefold后的关键词
+            limit: 命中数达到该值后停止查找（None表示查找全部）
+
+        Returns:
+            按添加顺序排列的文献ID列表
+        """
+        corpus, starts, ids = self._get_search_corpus()
+        if not ids:
+            return []
+
+        matched_ids = []
+        pos = corpus.find(keyword_folded)
+        while pos != -1:
+            index = bisect.bisect_right(starts, pos) - 1
+            matched_ids.append(ids[index])
+            if index + 1 >= len(starts) or len(matched_ids) == limit:
+                break
+            pos = corpus.find(keyword_folded, starts[index + 1])
+        return matched_ids
+
+    def _index_item_text(self, item: StoredLiteratureItem):
+        """更新文献在内存文本中的条目（内存文本尚未构建时跳过）"""
+        if self._search_blob is None:
+            return
+        self._search_corpus = None
+        self._search_blob[item.id] = SEARCH_BLOB_SEPARATOR.join(filter(None, (
+            item.title,
+            item.authors,
+            "\x1f".join(item.keywords),
+            item.abstract,
+            item.core_conclusion,
+        ))).casefold()
+
+    def _unindex_item_text(self, item_id: str):
+        """从内存文本中移除文献"""
+        if self._search_blob is not None:
+            self._search_blob.pop(item_id, None)
+            self._search_corpus = None
+
+    def _fts_match(self, keyword: str, limit: Optional[int] = None) -> List[str]:
+        """
+        用FTS5全文索引查找包含关键词的文献
+
+        Args:
+            keyword: 关键词（不少于 FTS_MIN_QUERY_LENGTH 个字符）
+            limit: 最多返回的文献数（None表示返回全部）
+
+        Returns:
+            按相关度排序的文献ID列表
+        """
+        # 作为短语查询，关键词中的引号需要转义
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT items.id FROM items_fts JOIN items ON items.pk = items_fts.rowid "
+                "WHERE items_fts MATCH ? ORDER BY items_fts.rank LIMIT ?",
+                (phrase, -1 if limit is None else limit)
+            ).fetchall()
+        return [row[0] for row in rows]
 
     def _generate_id(self, item: Union[StoredLiteratureItem, Dict]) -> str:
         """生成文献唯一ID"""
@@ -162,41 +903,162 @@ class LiteratureStorageTool:
             authors = item.authors
             year = item.year
 
-        content = f"{title}_{authors}_{year}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        content = f"{title}_{authors}_{year}".encode('utf-8')
+        if self._id_scheme == "blake2b":
+            return hashlib.blake2b(content, digest_size=6).hexdigest()
+        return hashlib.md5(content).hexdigest()[:12]
 
     def _create_document_text(self, item: StoredLiteratureItem) -> str:
-        """创建用于嵌入的文档文本"""
-        parts = [
-            f"标题: {item.title}",
-            f"作者: {item.authors}",
-            f"年份: {item.year}",
-        ]
-
-        if item.journal:
-            parts.append(f"期刊: {item.journal}")
-        if item.abstract:
-            parts.append(f"摘要: {item.abstract}")
-        if item.keywords:
-            parts.append(f"关键词: {', '.join(item.keywords)}")
-        if item.core_conclusion:
-            parts.append(f"核心结论: {item.core_conclusion}")
-        if item.theoretical_mechanism:
-            parts.append(f"理论机制: {', '.join(item.theoretical_mechanism)}")
-        if item.variable_x_definition:
-            parts.append(f"解释变量定义: {item.variable_x_definition}")
-        if item.variable_y_definition:
-            parts.append(f"被解释变量定义: {item.variable_y_definition}")
-        if item.identification_strategy:
-            parts.append(f"识别策略: {item.identification_strategy}")
-
-        return "\n".join(parts)
+        """创建用于嵌入的文档文本（字段只读取一次，所有片段放进一个列表后一次join）"""
+        fields = item.__dict__
+        parts = ["标题: ", fields["title"], "\n作者: ", fields["authors"], "\n年份: ", str(fields["year"])]
+        append = parts.append
+        for label, name in (
+            ("\n期刊: ", "journal"),
+            ("\n摘要: ", "abstract"),
+            ("\n关键词: ", "keywords"),
+            ("\n核心结论: ", "core_conclusion"),
+            ("\n理论机制: ", "theoretical_mechanism"),
+            ("\n解释变量定义: ", "variable_x_definition"),
+            ("\n被解释变量定义: ", "variable_y_definition"),
+            ("\n识别策略: ", "identification_strategy"),
+        ):
+            value = fields[name]
+            if value:
+                append(label)
+                append(", ".join(value) if isinstance(value, list) else value)
+        return "".join(parts)
 
     def _get_embedding(self, text: str) -> Optional[List[float]]:
-        """获取文本嵌入向量"""
-        if self.embedding_model:
-            return self.embedding_model.encode(text).tolist()
-        return None
+        """获取文本嵌入向量（较短的查询文本走LRU缓存）"""
+        if not self.embedding_model:
+            return None
+        if len(text) > QUERY_EMBEDDING_CACHE_MAX_CHARS:
+            return list(self._encode_query(text))
+        return list(self._cached_query_embedding(text))
+
+    def _encode_query(self, text: str) -> tuple:
+        """编码单条文本，返回不可变的元组以便缓存"""
+        return tuple(self.embedding_model.encode(
+            text,
+            convert_to_numpy=True,
+            normalize_embeddings=self.normalize_embeddings
+        ).tolist())
+
+    def _get_embeddings(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """
+        批量获取文档嵌入向量
+
+        先按文本内容哈希查找持久化的嵌入缓存，只对未命中的文本做一次批量前向计算，
+        因此重复导入或只修改了非文本字段的更新不会重新编码。新编码的向量按批写入分片文件。
+
+        Args:
+            texts: 文档文本列表
+
+        Returns:
+            嵌入向量列表；嵌入模型不可用时返回None
+        """
+        if not (self.embedding_model and texts):
+            return None
+
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest() for text in texts]
+        embeddings = self._load_cached_embeddings(keys)
+        missing = [i for i, emb in enumerate(embeddings) if emb is None]
+
+        if missing:
+            encoded = self.embedding_model.encode(
+                [texts[i] for i in missing],
+                batch_size=EMBEDDING_BATCH_SIZE,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+                normalize_embeddings=self.normalize_embeddings
+            )
+            stored = _quantize_embedding(np.asarray(encoded, dtype=np.float32), self.storage_dtype)
+            self._save_cached_embeddings([keys[i] for i in missing], stored)
+            for i, vector in zip(missing, stored):
+                embeddings[i] = _dequantize_embedding(vector)
+
+        return [emb.tolist() for emb in embeddings]
+
+    def _refresh_embedding_index(self):
+        """扫描缓存目录，把尚未索引的分片（包括其他进程写入的）加入索引"""
+        for shard_file in self.embedding_cache_dir.glob("shard_*.npz"):
+            if shard_file in self._embedding_shards:
+                continue
+            try:
+                with np.load(shard_file) as shard:
+                    shard_keys = shard["keys"].tolist()
+            except (KeyError, ValueError, OSError) as e:
+                logger.debug(f"跳过损坏的嵌入缓存分片 {shard_file.name}: {e}")
+                continue
+            self._embedding_shards.add(shard_file)
+            for row, key in enumerate(shard_keys):
+                self._embedding_index[key] = (shard_file, row)
+
+    def _load_cached_embeddings(self, keys: List[str]) -> List[Optional["np.ndarray"]]:
+        """
+        批量读取缓存的嵌入向量（同一分片只读取一次）
+
+        Args:
+            keys: 文本哈希列表
+
+        Returns:
+            与keys一一对应的float32向量，未命中的位置为None
+        """
+        with self._embedding_lock:
+            if any(key not in self._embedding_index for key in keys):
+                self._refresh_embedding_index()
+            locations = [self._embedding_index.get(key) for key in keys]
+
+        by_shard: Dict[Path, List[Tuple[int, int]]] = {}
+        for i, location in enumerate(locations):
+            if location is not None:
+                by_shard.setdefault(location[0], []).append((i, location[1]))
+
+        embeddings: List[Optional["np.ndarray"]] = [None] * len(keys)
+        for shard_file, entries in by_shard.items():
+            try:
+                with np.load(shard_file) as shard:
+                    vectors = shard["vectors"]
+            except (KeyError, ValueError, OSError):
+                continue
+            for i, row in entries:
+                embeddings[i] = _dequantize_embedding(vectors[row])
+
+        # 兼容旧版每个文档一个 .npy 文件的缓存
+        for i, key in enumerate(keys):
+            if embeddings[i] is None:
+                try:
+                    embeddings[i] = _dequantize_embedding(np.load(self.embedding_cache_dir / f"{key}.npy"))
+                except (ValueError, OSError):
+                    pass
+        return embeddings
+
+    def _save_cached_embeddings(self, keys: List[str], vectors: "np.ndarray"):
+        """
+        把一批嵌入向量写入新的分片文件（先写临时文件再原子替换）
+
+        Args:
+            keys: 文本哈希列表
+            vectors: 与keys对应的压缩后向量矩阵
+        """
+        try:
+            self.embedding_cache_dir.mkdir(parents=True, exist_ok=True)
+            for start in range(0, len(keys), EMBEDDING_SHARD_ROWS):
+                shard_keys = keys[start:start + EMBEDDING_SHARD_ROWS]
+                # 分片名取自其中的键，不同进程同时写入也不会互相覆盖
+                digest = hashlib.blake2b("".join(shard_keys).encode('ascii'), digest_size=16).hexdigest()
+                shard_file = self.embedding_cache_dir / f"shard_{digest}.npz"
+                tmp_file = shard_file.with_suffix(".tmp")
+                with open(tmp_file, "wb") as f:
+                    np.savez(f, keys=np.array(shard_keys), vectors=vectors[start:start + EMBEDDING_SHARD_ROWS])
+                os.replace(tmp_file, shard_file)
+                with self._embedding_lock:
+                    self._embedding_shards.add(shard_file)
+                    for row, key in enumerate(shard_keys):
+                        self._embedding_index[key] = (shard_file, row)
+        except OSError as e:
+            logger.debug(f"嵌入缓存写入失败: {e}")
 
     def _extract_author_from_filename(self, filename: str) -> Optional[str]:
         """
@@ -210,8 +1072,6 @@ class LiteratureStorageTool:
         Returns:
             提取的作者名，若无法提取则返回None
         """
-        import re
-
         if not filename:
             return None
 
@@ -227,16 +1087,13 @@ class LiteratureStorageTool:
 
         # 验证是否像中文作者名（2-4个汉字，可能带"等"字）
         # 或英文作者名
-        chinese_pattern = re.compile(r'^[\u4e00-\u9fa5]{2,4}(等)?$')
-        english_pattern = re.compile(r'^[A-Za-z\s\.\-]+$')
-
-        if chinese_pattern.match(author_candidate) or english_pattern.match(author_candidate):
+        if _CHINESE_AUTHOR_RE.match(author_candidate) or _ENGLISH_AUTHOR_RE.match(author_candidate):
             return author_candidate
 
         # 如果最后一部分不像作者名，尝试倒数第二部分
         if len(parts) >= 3:
             author_candidate = parts[-2].strip()
-            if chinese_pattern.match(author_candidate) or english_pattern.match(author_candidate):
+            if _CHINESE_AUTHOR_RE.match(author_candidate) or _ENGLISH_AUTHOR_RE.match(author_candidate):
                 return author_candidate
 
         return None
@@ -254,28 +1111,23 @@ class LiteratureStorageTool:
         Returns:
             提取的年份，若无法提取则返回None
         """
-        import re
-
         if not text:
             return None
 
         # 优先匹配括号中的年份
-        bracket_pattern = re.compile(r'[（\(](\d{4})[-—～]?(\d{4})?[）\)]')
-        match = bracket_pattern.search(text)
+        match = _BRACKET_YEAR_RE.search(text)
         if match:
             year1 = int(match.group(1))
             year2 = int(match.group(2)) if match.group(2) else year1
             return max(year1, year2)  # 返回较新的年份
 
         # 匹配"XXXX年"格式
-        year_pattern = re.compile(r'(\d{4})年')
-        match = year_pattern.search(text)
+        match = _YEAR_SUFFIX_RE.search(text)
         if match:
             return int(match.group(1))
 
         # 匹配独立的4位年份数字（2000-2030范围）
-        standalone_pattern = re.compile(r'\b(20[0-3]\d)\b')
-        matches = standalone_pattern.findall(text)
+        matches = _STANDALONE_YEAR_RE.findall(text)
         if matches:
             return int(matches[-1])  # 返回最后一个匹配
 
@@ -283,30 +1135,33 @@ class LiteratureStorageTool:
 
     # ==================== 核心功能 ====================
 
-    def add_literature(
+    def _prepare_item(
         self,
         item: Union[StoredLiteratureItem, Dict[str, Any]],
-        source: str = "manual"
-    ) -> str:
+        source: str
+    ) -> StoredLiteratureItem:
         """
-        添加单篇文献
+        规范化文献项：分配ID、补充元数据并校验
 
         Args:
             item: 文献项(Pydantic模型或字典)
             source: 来源标识
 
         Returns:
-            文献ID
+            校验后的文献项
         """
-        # Step 1: Ensure we are working with a dictionary
+        # 已经是校验过的模型：只替换ID和来源，跳过 model_dump + 重新校验的往返
         if isinstance(item, StoredLiteratureItem):
-            item_dict = item.model_dump()
-        else:
-            item_dict = item.copy()
+            return item.model_copy(update={
+                'id': self._generate_id(item),
+                'source': source
+            })
+
+        # Step 1: Ensure we are working with a dictionary
+        item_dict = item.copy()
 
         # Step 2: Generate and assign ID
-        item_id = self._generate_id(item_dict)
-        item_dict['id'] = item_id
+        item_dict['id'] = self._generate_id(item_dict)
 
         # Step 3: Add other metadata
         item_dict['source'] = source
@@ -314,75 +1169,247 @@ class LiteratureStorageTool:
             item_dict['added_at'] = datetime.now().isoformat()
 
         # Step 4: Validate and create the Pydantic model
-        validated_item = StoredLiteratureItem(**item_dict)
+        return StoredLiteratureItem(**item_dict)
+
+    def _persist_item(self, validated_item: StoredLiteratureItem):
+        """
+        更新索引（不提交事务），启用 json_backups 时同时写入JSON备份
+
+        Args:
+            validated_item: 校验后的文献项
+        """
+        item_id = validated_item.id
+        # 备份和索引的json列共用一次导出结果
+        data = validated_item.model_dump()
 
         # 1. 保存到JSON备份
-        backup_file = self.backup_dir / f"{item_id}.json"
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(validated_item.model_dump(), f, ensure_ascii=False, indent=2)
-
-        # 2. 更新索引
-        self.index["items"][item_id] = {
-            "title": validated_item.title,
-            "authors": validated_item.authors,
-            "year": validated_item.year,
-            "journal": validated_item.journal,
-            "added_at": validated_item.added_at,
-            "source": validated_item.source,
-            "tags": validated_item.tags
-        }
-        self.index["stats"]["total"] = len(self.index["items"])
+        if self.json_backups:
+            backup_file = self.backup_dir / f"{item_id}.json"
+            _atomic_write_bytes(backup_file, _json_dumps(data))
 
-        # 统计年份
-        year_str = str(validated_item.year)
-        self.index["stats"]["by_year"][year_str] = self.index["stats"]["by_year"].get(year_str, 0) + 1
+        # 2. 更新索引（同ID覆盖，FTS由触发器同步）
+        with self._db_lock:
+            self._db.execute(_UPSERT_SQL, self._item_row(validated_item, data))
+            self._dirty = True
 
-        # 统计期刊
-        if validated_item.journal:
-            self.index["stats"]["by_journal"][validated_item.journal] = \
-                self.index["stats"]["by_journal"].get(validated_item.journal, 0) + 1
+        self._index_item_text(validated_item)
+        self._cache_item(validated_item)
 
-        self._save_index()
+    def _add_to_vector_db(
+        self,
+        items: List[StoredLiteratureItem],
+        batch_size: int = CHROMA_BATCH_SIZE
+    ):
+        """
+        写入向量数据库；启用 async_writes 时放入后台队列后立即返回
 
-        # 3. 添加到向量数据库
-        if self.collection is not None:
-            doc_text = self._create_document_text(validated_item)
-            embedding = self._get_embedding(doc_text)
+        Args:
+            items: 校验后的文献项列表
+            batch_size: 每次 collection.add 的文献数（后台队列按 ASYNC_BATCH_SIZE 凑批）
+        """
+        if self.collection is None or not items:
+            return
+
+        if self._write_queue is not None:
+            for item in items:
+                self._write_queue.put(item)
+            return
+
+        self._write_vector_batch(items, batch_size)
+
+    def _write_vector_batch(
+        self,
+        items: List[StoredLiteratureItem],
+        batch_size: int = CHROMA_BATCH_SIZE
+    ):
+        """
+        批量写入向量数据库：每 batch_size 篇文献编码一次、调用一次collection.add
+
+        Args:
+            items: 校验后的文献项列表
+            batch_size: 每次 collection.add 的文献数
+        """
+        # 同一批次内ID重复会导致ChromaDB整批失败，保留最后一次出现的条目
+        unique_items = list({item.id: item for item in items}.values())
+
+        for start in range(0, len(unique_items), batch_size):
+            chunk = unique_items[start:start + batch_size]
+            doc_texts = [self._create_document_text(item) for item in chunk]
+            embeddings = self._get_embeddings(doc_texts)
 
             try:
-                metadata_to_store = {
-                    "title": validated_item.title,
-                    "authors": validated_item.authors,
-                    "year": validated_item.year,
-                    "journal": validated_item.journal or "",
-                    "source": validated_item.source,
-                    "tags": ",".join(validated_item.tags)
+                kwargs = {
+                    "ids": [item.id for item in chunk],
+                    "documents": doc_texts,
+                    "metadatas": [self._vector_metadata(item) for item in chunk]
                 }
-                if embedding:
-                    self.collection.add(
-                        ids=[item_id],
-                        documents=[doc_text],
-                        embeddings=[embedding],
-                        metadatas=[metadata_to_store]
-                    )
-                else:
-                    # 使用ChromaDB默认嵌入
-                    self.collection.add(
-                        ids=[item_id],
-                        documents=[doc_text],
-                        metadatas=[metadata_to_store]
-                    )
-                logger.info(f"文献已添加到向量数据库: {validated_item.title[:50]}...")
+                if embeddings:
+                    kwargs["embeddings"] = embeddings
+                # 未提供embeddings时使用ChromaDB默认嵌入
+                self.collection.add(**kwargs)
+                logger.info(f"{len(chunk)} 篇文献已添加到向量数据库")
             except Exception as e:
                 logger.error(f"添加到向量数据库失败: {e}")
 
-        logger.info(f"文献添加成功: [{item_id}] {validated_item.title}")
-        return item_id
+    def _vector_metadata(self, item: StoredLiteratureItem) -> Dict[str, Any]:
+        """向量数据库中保存的文献元数据（只保留过滤用的字段，其余信息按ID从索引读取）"""
+        return {
+            "year": item.year,
+            "journal": item.journal or "",
+            "source": item.source
+        }
+
+    def _update_vector_db(
+        self,
+        old_item: StoredLiteratureItem,
+        new_item: StoredLiteratureItem,
+        text_may_change: bool = True
+    ):
+        """
+        原地更新向量数据库中的文献：文档文本未变时只更新元数据，否则重新嵌入后upsert
+
+        Args:
+            old_item: 更新前的文献
+            new_item: 更新后的文献（ID相同）
+            text_may_change: 更新是否涉及文档文本字段；为False时不构造文本，元数据也未变则不访问向量库
+        """
+        if self.collection is None:
+            return
+
+        metadata = self._vector_metadata(new_item)
+        if not text_may_change and metadata == self._vector_metadata(old_item):
+            return
+
+        # 先写完排队中的新增，避免被后台线程覆盖
+        self._wait_vector_writes()
+
+        new_text = None
+        if text_may_change:
+            new_text = self._create_document_text(new_item)
+        try:
+            if new_text is None or new_text == self._create_document_text(old_item):
+                # 不触碰HNSW图，也不重新编码
+                self.collection.update(ids=[new_item.id], metadatas=[metadata])
+            else:
+                kwargs = {
+                    "ids": [new_item.id],
+                    "documents": [new_text],
+                    "metadatas": [metadata]
+                }
+                embeddings = self._get_embeddings([new_text])
+                if embeddings:
+                    kwargs["embeddings"] = embeddings
+                self.collection.upsert(**kwargs)
+        except Exception as e:
+            logger.error(f"更新向量数据库失败: {e}")
+
+    def add_literature(
+        self,
+        item: Union[StoredLiteratureItem, Dict[str, Any]],
+        source: str = "manual",
+        defer_save: bool = False,
+        overwrite: bool = False
+    ) -> str:
+        """
+        添加单篇文献
+
+        Args:
+            item: 文献项(Pydantic模型或字典)
+            source: 来源标识
+            defer_save: 是否延迟提交索引（批量导入时使用，结束后需调用flush）
+            overwrite: 文献已存在时是否用新内容原地更新（默认直接返回已有ID）
+
+        Returns:
+            文献ID
+        """
+        item_id = self._generate_id(item)
+        if self._exists(item_id):
+            if overwrite:
+                self._overwrite_literature(item_id, item)
+            else:
+                logger.debug(f"文献已存在，跳过: [{item_id}]")
+            return item_id
+
+        validated_item = self._prepare_item(item, source)
+
+        self._persist_item(validated_item)
+        if not defer_save:
+            self._save_index()
+
+        # 3. 添加到向量数据库
+        self._add_to_vector_db([validated_item])
+
+        logger.info(f"文献添加成功: [{validated_item.id}] {validated_item.title}")
+        return validated_item.id
+
+    def _exists(self, item_id: str) -> bool:
+        """索引中是否已有该文献"""
+        with self._db_lock:
+            return self._db.execute(
+                "SELECT 1 FROM items WHERE id = ?", (item_id,)
+            ).fetchone() is not None
+
+    def _overwrite_literature(
+        self,
+        item_id: str,
+        item: Union[StoredLiteratureItem, Dict[str, Any]]
+    ):
+        """用新内容原地更新已存在的文献"""
+        updates = item.model_dump() if isinstance(item, StoredLiteratureItem) else dict(item)
+        self.update_literature(item_id, updates)
+
+    def _add_literature_batch_fast(
+        self,
+        items: List[Union[StoredLiteratureItem, Dict[str, Any]]],
+        source: str,
+        overwrite: bool = False,
+        batch_size: int = CHROMA_BATCH_SIZE
+    ) -> Tuple[List[str], List[str]]:
+        """
+        批量添加文献的快速路径
+
+        逐条校验并写入备份，最后只保存一次索引、只调用一次嵌入模型和collection.add。
+        已存在的文献不会重新编码和写入（overwrite=True 时逐条原地更新）。
+
+        Args:
+            items: 文献列表
+            source: 来源标识
+            overwrite: 文献已存在时是否原地更新
+            batch_size: 每次 collection.add 的文献数
+
+        Returns:
+            (新添加的文献ID列表, 已存在的文献ID列表)
+        """
+        validated_items = []
+        duplicate_ids = []
+        for item in items:
+            try:
+                item_id = self._generate_id(item)
+                if self._exists(item_id):
+                    if overwrite:
+                        self._overwrite_literature(item_id, item)
+                    duplicate_ids.append(item_id)
+                    continue
+
+                validated_item = self._prepare_item(item, source)
+                self._persist_item(validated_item)
+                validated_items.append(validated_item)
+            except Exception as e:
+                title = item.get('title', 'Unknown') if isinstance(item, dict) else item.title
+                logger.error(f"批量添加失败: {title}, 错误: {e}")
+
+        if validated_items:
+            self._save_index()
+            self._add_to_vector_db(validated_items, batch_size)
+
+        return [item.id for item in validated_items], duplicate_ids
 
     def add_literature_batch(
         self,
         items: List[Union[StoredLiteratureItem, Dict[str, Any]]],
-        source: str = "batch_import"
+        source: str = "batch_import",
+        overwrite: bool = False,
+        batch_size: int = CHROMA_BATCH_SIZE
     ) -> List[str]:
         """
         批量添加文献
@@ -390,20 +1417,110 @@ class LiteratureStorageTool:
         Args:
             items: 文献列表
             source: 来源标识
+            overwrite: 文献已存在时是否原地更新（默认跳过）
+            batch_size: 每次写入向量数据库的文献数
+
+        Returns:
+            文献ID列表（包括已存在的文献）
+        """
+        ids, duplicate_ids = self._add_literature_batch_fast(items, source, overwrite, batch_size)
+
+        logger.info(
+            f"批量添加完成: 新增 {len(ids)}/{len(items)} 篇文献, 已存在 {len(duplicate_ids)} 篇"
+        )
+        return ids + duplicate_ids
+
+    def _semantic_ids(
+        self,
+        query: str,
+        n_results: int,
+        where_filter: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        向量检索，只返回按相似度排序的文献ID（不加载文献）
+
+        Args:
+            query: 查询文本
+            n_results: 返回结果数
+            where_filter: ChromaDB元数据过滤条件
 
         Returns:
             文献ID列表
         """
-        ids = []
-        for item in items:
-            try:
-                item_id = self.add_literature(item, source)
-                ids.append(item_id)
-            except Exception as e:
-                logger.error(f"批量添加失败: {e}")
+        # 等待后台写入完成，保证刚添加的文献可以被检索到
+        self._wait_vector_writes()
+
+        # 获取查询嵌入
+        query_embedding = self._get_embedding(query)
+        if query_embedding is None and not self._query_texts_warned:
+            # 没有本地模型时文档由ChromaDB默认嵌入函数编码，查询也交给它编码才能保持一致
+            logger.warning("本地嵌入模型不可用，语义搜索使用ChromaDB默认嵌入函数编码查询")
+            self._query_texts_warned = True
+
+        # 结果只需要ID，不取回文档和元数据
+        if query_embedding:
+            results = self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where_filter if where_filter else None,
+                include=["distances"]
+            )
+        else:
+            results = self.collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                where=where_filter if where_filter else None,
+                include=["distances"]
+            )
 
-        logger.info(f"批量添加完成: {len(ids)}/{len(items)} 篇文献")
-        return ids
+        if results['ids'] and results['ids'][0]:
+            return list(results['ids'][0])
+        return []
+
+    def _semantic_ids_or_empty(self, query: str, n_results: int) -> List[str]:
+        """向量检索，失败时记录日志并返回空列表（混合搜索用）"""
+        try:
+            return self._semantic_ids(query, n_results)
+        except Exception as e:
+            logger.error(f"语义搜索失败: {e}")
+            return []
+
+    def _keyword_ids(self, keyword: str, fields: List[str], limit: Optional[int] = None) -> List[str]:
+        """
+        关键词匹配，只返回命中的文献ID（默认字段不加载文献）
+
+        Args:
+            keyword: 关键词
+            fields: 搜索字段
+            limit: 命中数达到该值后提前结束（None表示匹配全部）
+
+        Returns:
+            文献ID列表
+        """
+        keyword_folded = keyword.casefold()
+
+        if set(fields) == set(KEYWORD_SEARCH_FIELDS):
+            if self._fts_trigram and len(keyword) >= FTS_MIN_QUERY_LENGTH:
+                # FTS5 trigram索引上的短语查询即子串匹配，按相关度排序
+                return self._fts_match(keyword, limit)
+            return self._blob_match(keyword_folded, limit)
+
+        matched_ids = []
+        for item in self._scan_items():
+            # 直接读取字段字典，跳过Pydantic的属性访问
+            values = item.__dict__
+            for field in fields:
+                value = values.get(field)
+                if not value:
+                    continue
+                if isinstance(value, list):
+                    value = SEARCH_BLOB_SEPARATOR.join(map(str, value))
+                if keyword_folded in str(value).casefold():
+                    matched_ids.append(item.id)
+                    break
+            if len(matched_ids) == limit:
+                break
+        return matched_ids
 
     def search_semantic(
         self,
@@ -436,29 +1553,8 @@ class LiteratureStorageTool:
             where_filter["journal"] = filter_journal
 
         try:
-            # 获取查询嵌入
-            query_embedding = self._get_embedding(query)
-
-            if query_embedding:
-                results = self.collection.query(
-                    query_embeddings=[query_embedding],
-                    n_results=n_results,
-                    where=where_filter if where_filter else None
-                )
-            else:
-                results = self.collection.query(
-                    query_texts=[query],
-                    n_results=n_results,
-                    where=where_filter if where_filter else None
-                )
-
             # 加载完整文献信息
-            items = []
-            if results['ids'] and results['ids'][0]:
-                for item_id in results['ids'][0]:
-                    item = self.get_literature(item_id)
-                    if item:
-                        items.append(item)
+            items = self._load_items(self._semantic_ids(query, n_results, where_filter))
 
             return LiteratureSearchResult(
                 items=items,
@@ -475,7 +1571,8 @@ class LiteratureStorageTool:
         self,
         keyword: str,
         fields: List[str] = None,
-        n_results: int = 10
+        n_results: int = 10,
+        count_all: bool = True
     ) -> LiteratureSearchResult:
         """
         关键词搜索(精确匹配)
@@ -484,36 +1581,22 @@ class LiteratureStorageTool:
             keyword: 关键词
             fields: 搜索字段(默认搜索标题、作者、关键词)
             n_results: 返回结果数
+            count_all: 是否统计全部命中数（默认是，total_count 为总匹配数）。
+                设为False时找到 n_results 篇后即停止，total_count 只是已找到的命中数，
+                适用于不需要总数的调用方
 
         Returns:
             搜索结果
         """
         if fields is None:
-            fields = ["title", "authors", "keywords", "abstract", "core_conclusion"]
-
-        keyword_lower = keyword.lower()
-        matched_items = []
-
-        for item_id in self.index["items"]:
-            item = self.get_literature(item_id)
-            if item is None:
-                continue
+            fields = list(KEYWORD_SEARCH_FIELDS)
 
-            # 检查各字段
-            for field in fields:
-                value = getattr(item, field, None)
-                if value:
-                    if isinstance(value, list):
-                        if any(keyword_lower in str(v).lower() for v in value):
-                            matched_items.append(item)
-                            break
-                    elif keyword_lower in str(value).lower():
-                        matched_items.append(item)
-                        break
+        matched_ids = self._keyword_ids(keyword, fields, None if count_all else n_results)
 
+        # 只加载需要返回的文献
         return LiteratureSearchResult(
-            items=matched_items[:n_results],
-            total_count=len(matched_items),
+            items=self._load_items(matched_ids[:n_results]),
+            total_count=len(matched_ids),
             query=keyword,
             search_type="keyword"
         )
@@ -527,6 +1610,10 @@ class LiteratureStorageTool:
         """
         混合搜索(语义+关键词)
 
+        两路检索只返回ID，用加权倒数排名融合(RRF)打分:
+        score = w / (k + rank_语义) + (1 - w) / (k + rank_关键词)，
+        最后只加载排名前 n_results 的文献。
+
         Args:
             query: 查询内容
             n_results: 返回结果数
@@ -535,29 +1622,27 @@ class LiteratureStorageTool:
         Returns:
             搜索结果
         """
-        # 执行两种搜索
-        semantic_results = self.search_semantic(query, n_results * 2)
-        keyword_results = self.search_keyword(query, n_results=n_results * 2)
-
-        # 合并结果(去重)
-        seen_ids = set()
-        merged_items = []
-
-        # 优先添加语义搜索结果
-        for item in semantic_results.items:
-            if item.id not in seen_ids:
-                seen_ids.add(item.id)
-                merged_items.append(item)
+        # 两种检索并发执行：向量检索在后台线程（编码和ChromaDB查询会释放GIL），关键词检索在当前线程
+        if self.collection is not None:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                semantic_future = executor.submit(self._semantic_ids_or_empty, query, n_results * 2)
+                keyword_ids = self._keyword_ids(query, list(KEYWORD_SEARCH_FIELDS), n_results * 2)
+                semantic_ids = semantic_future.result()
+        else:
+            semantic_ids = []
+            keyword_ids = self._keyword_ids(query, list(KEYWORD_SEARCH_FIELDS), n_results * 2)
 
-        # 添加关键词搜索结果
-        for item in keyword_results.items:
-            if item.id not in seen_ids:
-                seen_ids.add(item.id)
-                merged_items.append(item)
+        # 加权倒数排名融合（同分时语义结果在前）
+        scores: Dict[str, float] = {}
+        for rank, item_id in enumerate(semantic_ids, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + semantic_weight / (RRF_K + rank)
+        for rank, item_id in enumerate(keyword_ids, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + (1 - semantic_weight) / (RRF_K + rank)
+        ranked_ids = sorted(scores, key=scores.get, reverse=True)
 
         return LiteratureSearchResult(
-            items=merged_items[:n_results],
-            total_count=len(merged_items),
+            items=self._load_items(ranked_ids[:n_results]),
+            total_count=len(ranked_ids),
             query=query,
             search_type="hybrid"
         )
@@ -572,12 +1657,29 @@ class LiteratureStorageTool:
         Returns:
             文献详情
         """
-        backup_file = self.backup_dir / f"{item_id}.json"
-        if backup_file.exists():
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return StoredLiteratureItem(**data)
-        return None
+        with self._cache_lock:
+            cached = self._item_cache.get(item_id)
+            if cached is not None:
+                self._item_cache.move_to_end(item_id)
+                return cached
+
+        with self._db_lock:
+            row = self._db.execute("SELECT json FROM items WHERE id = ?", (item_id,)).fetchone()
+        if row is None:
+            return None
+
+        # 写入索引前已校验过，直接构造以跳过重复校验
+        item = StoredLiteratureItem.model_construct(**_json_loads(row[0]))
+        self._cache_item(item)
+        return item
+
+    def _cache_item(self, item: StoredLiteratureItem):
+        """放入LRU缓存，超出上限时淘汰最久未使用的条目"""
+        with self._cache_lock:
+            self._item_cache[item.id] = item
+            self._item_cache.move_to_end(item.id)
+            if len(self._item_cache) > ITEM_CACHE_SIZE:
+                self._item_cache.popitem(last=False)
 
     def delete_literature(self, item_id: str) -> bool:
         """
@@ -589,26 +1691,56 @@ class LiteratureStorageTool:
         Returns:
             是否成功
         """
-        # 从索引删除
-        if item_id in self.index["items"]:
-            del self.index["items"][item_id]
-            self.index["stats"]["total"] = len(self.index["items"])
-            self._save_index()
+        self.delete_many([item_id])
+        logger.info(f"文献已删除: {item_id}")
+        return True
 
-        # 从备份删除
-        backup_file = self.backup_dir / f"{item_id}.json"
-        if backup_file.exists():
-            backup_file.unlink()
+    def delete_many(self, ids: List[str]) -> int:
+        """
+        批量删除文献，索引和向量数据库都按批删除
+
+        Args:
+            ids: 文献ID列表
+
+        Returns:
+            从索引中实际删除的文献数量
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return 0
+
+        # 从索引删除（FTS由触发器同步）
+        deleted = 0
+        with self._db_lock:
+            for start in range(0, len(ids), SQLITE_MAX_VARIABLES):
+                chunk = ids[start:start + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                deleted += self._db.execute(
+                    f"DELETE FROM items WHERE id IN ({placeholders})", chunk
+                ).rowcount
+            self._dirty = True
+        self._save_index()
+        with self._cache_lock:
+            for item_id in ids:
+                self._item_cache.pop(item_id, None)
+        for item_id in ids:
+            self._unindex_item_text(item_id)
+
+        # 从备份删除（包括旧版本留下的备份，避免重新迁移时复活）
+        if self.backup_dir.exists():
+            for item_id in ids:
+                (self.backup_dir / f"{item_id}.json").unlink(missing_ok=True)
 
         # 从向量数据库删除
         if self.collection is not None:
-            try:
-                self.collection.delete(ids=[item_id])
-            except Exception as e:
-                logger.error(f"从向量数据库删除失败: {e}")
+            self._wait_vector_writes()
+            for start in range(0, len(ids), CHROMA_BATCH_SIZE):
+                try:
+                    self.collection.delete(ids=ids[start:start + CHROMA_BATCH_SIZE])
+                except Exception as e:
+                    logger.error(f"从向量数据库删除失败: {e}")
 
-        logger.info(f"文献已删除: {item_id}")
-        return True
+        return deleted
 
     def update_literature(
         self,
@@ -618,6 +1750,8 @@ class LiteratureStorageTool:
         """
         更新文献信息
 
+        标题/作者/年份变化后的新ID若与另一篇已有文献冲突，抛出ValueError且不做任何修改。
+
         Args:
             item_id: 文献ID
             updates: 更新内容
@@ -632,14 +1766,30 @@ class LiteratureStorageTool:
         # 更新字段
         item_dict = item.model_dump()
         item_dict.update(updates)
+        updated_fields = updates.keys()
+
+        new_id = self._generate_id(item_dict) if not _ID_FIELDS.isdisjoint(updated_fields) else item_id
+        if new_id != item_id:
+            # 标题/作者/年份变化导致ID变化：先检查新ID是否已被占用，避免删除原记录后添加被跳过
+            if self._exists(new_id):
+                raise ValueError(
+                    f"更新后的文献与已有文献 [{new_id}] 的标题/作者/年份相同，拒绝更新 [{item_id}]"
+                )
+            # 删除旧记录后按新ID添加
+            self.delete_literature(item_id)
+            new_item = StoredLiteratureItem(**item_dict)
+            self.add_literature(new_item, source="update")
+            return self.get_literature(new_id)
 
-        # 删除旧记录
-        self.delete_literature(item_id)
-
-        # 添加新记录
+        # ID不变：原地覆盖备份和索引，向量库中只在文档文本变化时重新嵌入
+        item_dict['id'] = item_id
+        item_dict['source'] = "update"
         new_item = StoredLiteratureItem(**item_dict)
-        self.add_literature(new_item, source="update")
+        self._persist_item(new_item)
+        self._save_index()
+        self._update_vector_db(item, new_item, not _EMBED_FIELDS.isdisjoint(updated_fields))
 
+        logger.info(f"文献已更新: [{item_id}] {new_item.title}")
         return new_item
 
     def list_all(
@@ -659,11 +1809,17 @@ class LiteratureStorageTool:
         Returns:
             文献列表
         """
-        items = []
-        for item_id in self.index["items"]:
-            item = self.get_literature(item_id)
-            if item:
-                items.append(item)
+        if sort_by in SORTABLE_COLUMNS:
+            # 在SQLite中排序并截取，只加载需要返回的文献
+            order = "DESC" if descending else "ASC"
+            with self._db_lock:
+                rows = self._db.execute(
+                    f"SELECT id FROM items ORDER BY {sort_by} {order}, pk {order} LIMIT ?",
+                    (limit,)
+                ).fetchall()
+            return self._load_items([row[0] for row in rows])
+
+        items = self._scan_items()
 
         # 排序
         items.sort(
@@ -675,10 +1831,20 @@ class LiteratureStorageTool:
 
     def get_statistics(self) -> Dict[str, Any]:
         """获取统计信息"""
+        with self._db_lock:
+            total = self._db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+            by_year = self._db.execute(
+                "SELECT year, COUNT(*) FROM items GROUP BY year"
+            ).fetchall()
+            by_journal = self._db.execute(
+                "SELECT journal, COUNT(*) FROM items "
+                "WHERE journal IS NOT NULL AND journal != '' GROUP BY journal"
+            ).fetchall()
+
         return {
-            "total_count": self.index["stats"]["total"],
-            "by_year": self.index["stats"]["by_year"],
-            "by_journal": self.index["stats"]["by_journal"],
+            "total_count": total,
+            "by_year": {str(year): count for year, count in by_year},
+            "by_journal": dict(by_journal),
             "storage_path": str(self.storage_dir),
             "chroma_available": self.collection is not None,
             "embedding_model": self.embedding_model_name if self.embedding_model else "default"
@@ -703,8 +1869,7 @@ class LiteratureStorageTool:
             "items": [item.model_dump() for item in items]
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _atomic_write_bytes(Path(output_file), _json_dumps(data))
 
         logger.info(f"已导出 {len(items)} 篇文献到: {output_file}")
         return output_file
@@ -719,8 +1884,8 @@ class LiteratureStorageTool:
         Returns:
             导入数量
         """
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            data = _json_loads(f.read())
 
         items = data.get("items", [])
         if not items:
@@ -746,7 +1911,7 @@ class LiteratureStorageTool:
             导入的文献ID列表
         """
         literature_list = literature_output.get("literature_list", [])
-        ids = []
+        items = []
 
         for lit in literature_list:
             # 转换格式
@@ -774,14 +1939,12 @@ class LiteratureStorageTool:
                 item_data["variable_y_definition"] = lit["variable_y"].get("definition", "")
                 item_data["variable_y_measurement"] = lit["variable_y"].get("measurement", "")
 
-            try:
-                item_id = self.add_literature(item_data, source="literature_collector")
-                ids.append(item_id)
-            except Exception as e:
-                logger.error(f"导入文献失败: {lit.get('title', 'Unknown')}, 错误: {e}")
+            items.append(item_data)
 
-        logger.info(f"从LiteratureCollector导入 {len(ids)} 篇文献")
-        return ids
+        ids, duplicate_ids = self._add_literature_batch_fast(items, source="literature_collector")
+
+        logger.info(f"从LiteratureCollector导入 {len(ids)} 篇文献, 已存在 {len(duplicate_ids)} 篇")
+        return ids + duplicate_ids
 
     def import_from_csv(
         self,
@@ -797,16 +1960,17 @@ class LiteratureStorageTool:
             csv_path: CSV文件路径
             column_mapping: 列名映射（CSV列名 -> 内部字段名）
             research_project: 关联的研究项目名称
-            batch_size: 批量导入大小（用于显示进度）
+            batch_size: 每批写入的文献数
 
         Returns:
             导入结果统计
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            logger.error("需要安装pandas: pip install pandas")
-            return {"success": False, "error": "pandas未安装"}
+        if not PYARROW_AVAILABLE:
+            try:
+                import pandas  # noqa: F401
+            except ImportError:
+                logger.error("需要安装pandas: pip install pandas")
+                return {"success": False, "error": "pandas未安装"}
 
         # 默认列名映射（针对"实证论文提取结果.csv"格式）
         default_mapping = {
@@ -822,89 +1986,168 @@ class LiteratureStorageTool:
         if column_mapping:
             default_mapping.update(column_mapping)
 
-        # 读取CSV
-        try:
-            df = pd.read_csv(csv_path, encoding='utf-8-sig')
-            logger.info(f"读取CSV文件: {len(df)} 行, 列: {list(df.columns)}")
-        except Exception as e:
-            logger.error(f"读取CSV失败: {e}")
-            return {"success": False, "error": str(e)}
-
         # 导入统计
         stats = {
-            "total": len(df),
+            "total": 0,
             "imported": 0,
             "skipped": 0,
+            "duplicates": 0,
             "errors": 0,
             "imported_ids": []
         }
 
-        # 逐行导入
-        for idx, row in df.iterrows():
-            try:
-                # 尝试从文件路径/文件名提取作者和年份
-                file_path = row.get("文件路径", "") if "文件路径" in df.columns else ""
-                title = row.get("文章名称", "") if "文章名称" in df.columns else ""
-
-                # 提取作者：优先从文件名，其次设为未知
-                extracted_author = None
-                if file_path:
-                    filename = Path(str(file_path)).name
-                    extracted_author = self._extract_author_from_filename(filename)
-
-                # 提取年份：优先从文件名，其次从标题
-                extracted_year = None
-                if file_path:
-                    extracted_year = self._extract_year_from_text(str(file_path))
-                if not extracted_year and title:
-                    extracted_year = self._extract_year_from_text(str(title))
+        file_path_pos = title_pos = None
+        mapped_columns: List[tuple] = []
+        try:
+            for chunk_index, (columns, rows) in enumerate(self._iter_csv_batches(csv_path, batch_size)):
+                if chunk_index == 0:
+                    logger.info(f"读取CSV文件: {csv_path}, 列: {columns}")
+                    col_pos = {col: i for i, col in enumerate(columns)}
+                    file_path_pos = col_pos.get("文件路径")
+                    title_pos = col_pos.get("文章名称")
+                    mapped_columns = [
+                        (col_pos[csv_col], field_name)
+                        for csv_col, field_name in default_mapping.items()
+                        if csv_col in col_pos
+                    ]
+
+                pending = []
+                for row in rows:
+                    stats["total"] += 1
+                    try:
+                        item_data = self._build_csv_item(
+                            row, file_path_pos, title_pos, mapped_columns, research_project
+                        )
+                    except Exception as e:
+                        stats["errors"] += 1
+                        logger.warning(f"导入第 {stats['total']} 行失败: {e}")
+                        continue
+
+                    # 检查必要字段
+                    if item_data is None:
+                        stats["skipped"] += 1
+                    else:
+                        pending.append(item_data)
+
+                # 批量添加到数据库
+                ids, duplicate_ids = self._add_literature_batch_fast(pending, source="csv_import")
+                stats["imported_ids"].extend(ids)
+                stats["imported"] += len(ids)
+                stats["duplicates"] += len(duplicate_ids)
+                stats["errors"] += len(pending) - len(ids) - len(duplicate_ids)
+                logger.info(f"导入进度: {stats['total']} 行")
+        except Exception as e:
+            logger.error(f"读取CSV失败: {e}")
+            stats.update(success=False, error=str(e))
+            return stats
 
-                # 构建文献数据
-                item_data = {
-                    "authors": extracted_author or "未知",
-                    "year": extracted_year or 2020,
-                    "source": "csv_import",
-                    "research_project": research_project,
-                    "tags": ["实证论文", "CSV导入"]
-                }
+        stats["success"] = True
+        logger.info(
+            f"CSV导入完成: 总计 {stats['total']} 行, "
+            f"成功 {stats['imported']}, 跳过 {stats['skipped']}, "
+            f"已存在 {stats['duplicates']}, 错误 {stats['errors']}"
+        )
 
-                # 映射列
-                for csv_col, field_name in default_mapping.items():
-                    if csv_col in df.columns:
-                        value = row.get(csv_col, "")
-                        if pd.notna(value) and str(value).strip():
-                            item_data[field_name] = str(value).strip()
+        return stats
 
-                # 检查必要字段
-                if not item_data.get("title"):
-                    stats["skipped"] += 1
-                    continue
+    def _iter_csv_batches(self, csv_path: str, batch_size: int):
+        """
+        流式读取CSV，每次产出 (列名列表, 至多batch_size行的元组列表)
 
-                # 从期刊信息推断（如果期刊格式包含年份）
-                journal = item_data.get("journal", "")
-                if journal:
-                    item_data["journal"] = journal
+        全部列按字符串读取，空单元格为""。安装了pyarrow时用其多线程读取器按
+        CSV_BLOCK_SIZE 分块解析，否则使用 pandas.read_csv(chunksize=...)。
 
-                # 添加到数据库
-                item_id = self.add_literature(item_data, source="csv_import")
-                stats["imported_ids"].append(item_id)
-                stats["imported"] += 1
+        Args:
+            csv_path: CSV文件路径
+            batch_size: 每批行数
+        """
+        if PYARROW_AVAILABLE:
+            # 先读表头，指定全部列为字符串类型，避免按块推断出不一致的类型
+            with open(csv_path, newline='', encoding='utf-8-sig') as f:
+                header = next(csv.reader(f), [])
+            reader = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                # 引号内的单元格可能含换行（如摘要），跨块边界时需要按引号切分
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header}
+                )
+            )
+            columns = reader.schema.names
+            for record_batch in reader:
+                rows = list(zip(*(column.to_pylist() for column in record_batch.columns)))
+                for start in range(0, len(rows), batch_size):
+                    yield columns, rows[start:start + batch_size]
+            return
+
+        import pandas as pd
+
+        reader = pd.read_csv(
+            csv_path,
+            encoding='utf-8-sig',
+            chunksize=batch_size,
+            dtype=str,
+            keep_default_na=False
+        )
+        for chunk in reader:
+            yield list(chunk.columns), list(chunk.itertuples(index=False, name=None))
 
-                # 显示进度
-                if (idx + 1) % batch_size == 0:
-                    logger.info(f"导入进度: {idx + 1}/{len(df)}")
+    def _build_csv_item(
+        self,
+        row: tuple,
+        file_path_pos: Optional[int],
+        title_pos: Optional[int],
+        mapped_columns: List[tuple],
+        research_project: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        将CSV的一行转换为文献数据
 
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning(f"导入第 {idx + 1} 行失败: {e}")
+        Args:
+            row: 行数据（按列位置）
+            file_path_pos: "文件路径"列的位置
+            title_pos: "文章名称"列的位置
+            mapped_columns: (列位置, 内部字段名) 列表
+            research_project: 关联的研究项目名称
 
-        stats["success"] = True
-        logger.info(
-            f"CSV导入完成: 总计 {stats['total']} 行, "
-            f"成功 {stats['imported']}, 跳过 {stats['skipped']}, 错误 {stats['errors']}"
-        )
+        Returns:
+            文献数据；缺少标题时返回None
+        """
+        # 尝试从文件路径/文件名提取作者和年份
+        file_path = row[file_path_pos] if file_path_pos is not None else ""
+        title = row[title_pos] if title_pos is not None else ""
+
+        # 提取作者：优先从文件名，其次设为未知
+        extracted_author = None
+        if file_path:
+            extracted_author = self._extract_author_from_filename(Path(file_path).name)
+
+        # 提取年份：优先从文件名，其次从标题
+        extracted_year = None
+        if file_path:
+            extracted_year = self._extract_year_from_text(file_path)
+        if not extracted_year and title:
+            extracted_year = self._extract_year_from_text(title)
+
+        # 构建文献数据
+        item_data = {
+            "authors": extracted_author or "未知",
+            "year": extracted_year or 2020,
+            "source": "csv_import",
+            "research_project": research_project,
+            "tags": ["实证论文", "CSV导入"]
+        }
 
-        return stats
+        # 映射列
+        for pos, field_name in mapped_columns:
+            value = row[pos].strip()
+            if value:
+                item_data[field_name] = value
+
+        if not item_data.get("title"):
+            return None
+        return item_data
 
     def import_from_pdf_directory(
         self,
@@ -940,13 +2183,13 @@ class LiteratureStorageTool:
         if not pdf_files:
             return {"success": True, "total": 0, "imported": 0, "skipped": 0, "errors": 0}
 
-        # 尝试导入PDF解析库
-        pdf_reader = None
+        # 尝试导入PDF解析库，可用时先用进程池并行提取全部PDF的首页文本
+        previews: Dict[Path, Optional[str]] = {}
         if extract_text:
             try:
-                import PyPDF2
-                pdf_reader = PyPDF2
+                import PyPDF2  # noqa: F401
                 logger.info("PyPDF2已加载，将提取PDF文本")
+                previews = self._extract_pdf_previews(pdf_files)
             except ImportError:
                 logger.warning("PyPDF2未安装，跳过文本提取。安装: pip install PyPDF2")
 
@@ -954,10 +2197,13 @@ class LiteratureStorageTool:
             "total": len(pdf_files),
             "imported": 0,
             "skipped": 0,
+            "duplicates": 0,
             "errors": 0,
             "imported_ids": []
         }
 
+        pending = []
+
         for pdf_file in pdf_files:
             try:
                 filename = pdf_file.name
@@ -983,23 +2229,10 @@ class LiteratureStorageTool:
                 else:
                     title = stem
                 # 清理标题中的括号年份
-                import re
-                title = re.sub(r'[（\(]\d{4}[-—～]?\d{0,4}[）\)]', '', title).strip()
+                title = _TITLE_YEAR_RE.sub('', title).strip()
 
-                # 提取PDF文本作为摘要（可选）
-                abstract = None
-                if pdf_reader:
-                    try:
-                        with open(pdf_file, 'rb') as f:
-                            reader = pdf_reader.PdfReader(f)
-                            if len(reader.pages) > 0:
-                                # 只读取第一页
-                                first_page = reader.pages[0].extract_text()
-                                if first_page:
-                                    # 截取前500字符作为摘要预览
-                                    abstract = first_page[:500].strip()
-                    except Exception as e:
-                        logger.debug(f"提取PDF文本失败 {filename}: {e}")
+                # PDF文本作为摘要（可选）
+                abstract = previews.get(pdf_file)
 
                 # 构建文献数据
                 item_data = {
@@ -1013,24 +2246,66 @@ class LiteratureStorageTool:
                     "notes": str(pdf_file.absolute())  # 保存原始文件路径
                 }
 
-                # 添加到数据库
-                item_id = self.add_literature(item_data, source="pdf_import")
-                stats["imported_ids"].append(item_id)
-                stats["imported"] += 1
-                logger.info(f"导入成功: {title} - {author} ({year})")
+                pending.append(item_data)
+                logger.debug(f"解析成功: {title} - {author} ({year})")
 
             except Exception as e:
                 stats["errors"] += 1
                 logger.warning(f"导入PDF失败 {pdf_file.name}: {e}")
 
+        # 批量添加到数据库：一次提交索引，文档批量编码后写入向量库
+        ids, duplicate_ids = self._add_literature_batch_fast(pending, source="pdf_import")
+        stats["imported_ids"] = ids
+        stats["imported"] = len(ids)
+        stats["duplicates"] = len(duplicate_ids)
+        stats["errors"] += len(pending) - len(ids) - len(duplicate_ids)
+
+        self.flush()
         stats["success"] = True
         logger.info(
             f"PDF导入完成: 总计 {stats['total']} 个, "
-            f"成功 {stats['imported']}, 错误 {stats['errors']}"
+            f"成功 {stats['imported']}, 已存在 {stats['duplicates']}, 错误 {stats['errors']}"
         )
 
         return stats
 
+    def _extract_pdf_previews(self, pdf_files: List[Path]) -> Dict[Path, Optional[str]]:
+        """
+        并行提取PDF首页文本（PyPDF2解析受GIL限制，使用进程池；超过 PDF_PREVIEW_MAX_BYTES 的文件跳过）
+
+        Args:
+            pdf_files: PDF文件列表
+
+        Returns:
+            文件路径 -> 摘要预览
+        """
+        previews: Dict[Path, Optional[str]] = {}
+        small_files = []
+        for pdf_file in pdf_files:
+            try:
+                too_large = pdf_file.stat().st_size > PDF_PREVIEW_MAX_BYTES
+            except OSError:
+                too_large = False
+            if too_large:
+                logger.debug(f"PDF过大，跳过文本提取: {pdf_file.name}")
+                previews[pdf_file] = None
+            else:
+                small_files.append(pdf_file)
+
+        paths = [str(pdf_file) for pdf_file in small_files]
+        workers = min(os.cpu_count() or 1, len(paths))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunksize = max(1, len(paths) // (workers * 4))
+                    previews.update(zip(small_files, executor.map(_extract_pdf_preview, paths, chunksize=chunksize)))
+                return previews
+            except Exception as e:
+                logger.warning(f"并行提取PDF文本失败，改为串行: {e}")
+
+        previews.update((pdf_file, _extract_pdf_preview(path)) for pdf_file, path in zip(small_files, paths))
+        return previews
+
 
 # ==================== 便捷函数 ====================
 
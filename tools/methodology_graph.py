@@ -12,22 +12,38 @@ Methodology Knowledge Graph Tool - Variable-Method Association Graph
 import os
 import re
 import json
+import codecs
+import heapq
 import hashlib
+import functools
+import itertools
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from collections import defaultdict
+import numpy as np
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from sentence_transformers import SentenceTransformer
-    import numpy as np
     EMBEDDINGS_AVAILABLE = True
 except ImportError:
     EMBEDDINGS_AVAILABLE = False
     logger.warning("sentence-transformers未安装，语义搜索将不可用")
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 try:
     from langchain.tools import Tool
     LANGCHAIN_AVAILABLE = True
@@ -35,6 +51,55 @@ except ImportError:
     LANGCHAIN_AVAILABLE = False
 
 
+# 预编译的正则（构建图谱时每个变量和方法都会调用）
+_PAREN_RE = re.compile(r'[（(].*?[）)]')
+_WS_RE = re.compile(r'\s+')
+_SEP_RE = re.compile(r'[,，、;；\n]')
+
+# 变量名标准化结果的缓存容量（构建图谱时同一变量会在多篇论文中重复出现）
+NORMALIZE_CACHE_SIZE = 20000
+
+# 节点嵌入以float16矩阵保存（加载时内存映射），行顺序记录在单独的ID列表中
+EMBEDDING_MATRIX_FILE = "embeddings.npy"
+EMBEDDING_IDS_FILE = "embedding_ids.json"
+LEGACY_EMBEDDING_FILE = "embeddings.json"
+
+# 计算节点嵌入时每批编码的变量数
+EMBEDDING_BATCH_SIZE = 256
+
+# 内存中嵌入矩阵支持的精度：int8 将单位向量的每个分量乘以127后取整，内存为float32的1/4
+EMBEDDING_MATRIX_DTYPES = ("float32", "int8")
+INT8_SCALE = 127.0
+
+# int8/float16矩阵打分时每块转换为float32的行数（限制临时float32内存）
+SCORE_BLOCK_ROWS = 16384
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码、缩进2格的JSON字节（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON字节（优先使用orjson，兼容带BOM的文件）"""
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_name(name: str) -> str:
+    """去除空白、括号内容并转小写（带缓存）"""
+    name = name.strip()
+    name = _PAREN_RE.sub('', name)  # 移除括号及其内容
+    name = _WS_RE.sub('', name)  # 移除空白
+    return name.lower()
+
+
 # ==================== 数据模型 ====================
 
 @dataclass
@@ -45,7 +110,7 @@ class VariableNode:
     normalized_name: str  # 标准化名称
     roles: Set[str] = field(default_factory=set)  # 角色集合: {"X", "Y"}
     papers: List[str] = field(default_factory=list)  # 出现的论文列表
-    embedding: Optional[List[float]] = None  # 语义向量
+    embedding: Optional[List[float]] = None  # 旧版 embeddings.json 中的语义向量（新版本保存在图谱的嵌入矩阵中）
 
     def to_dict(self) -> Dict:
         return {
@@ -68,7 +133,15 @@ class MethodEdge:
     research_question: str  # 研究问题
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # 字段都是字符串，直接构造字典，避免 asdict 的递归深拷贝
+        return {
+            "id": self.id,
+            "source_id": self.source_id,
+            "target_id": self.target_id,
+            "method": self.method,
+            "paper_title": self.paper_title,
+            "research_question": self.research_question,
+        }
 
 
 @dataclass
@@ -81,6 +154,42 @@ class SubgraphResult:
     papers: List[str]  # 相关论文
 
 
+@dataclass
+class _CSRAdjacency:
+    """压缩稀疏行（CSR）格式的邻接表，节点用整数行号表示，重复的X->Y只保留一条"""
+    row_ids: List[str]  # 行号 -> 节点ID
+    rows: Dict[str, int]  # 节点ID -> 行号
+    out_indptr: np.ndarray  # 正向邻居（该节点作为X指向的Y）的行偏移
+    out_indices: np.ndarray
+    in_indptr: np.ndarray  # 反向邻居（指向该节点的X）的行偏移
+    in_indices: np.ndarray
+
+
+def _build_csr(sources: np.ndarray, targets: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    由边的起点/终点行号构建CSR
+
+    Args:
+        sources: 起点行号
+        targets: 终点行号
+        n: 节点总数
+
+    Returns:
+        (indptr, indices)，第i行的邻居为 indices[indptr[i]:indptr[i + 1]]
+    """
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return indptr, targets[order]
+
+
+def _csr_neighbors(indptr: np.ndarray, indices: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """取出若干行在CSR中的全部邻居（按行拼接，可能有重复）"""
+    if rows.size == 0:
+        return indices[:0]
+    return np.concatenate([indices[indptr[row]:indptr[row + 1]] for row in rows])
+
+
 # ==================== 知识图谱核心类 ====================
 
 class MethodologyKnowledgeGraph:
@@ -101,62 +210,104 @@ class MethodologyKnowledgeGraph:
     def __init__(
         self,
         storage_dir: str = "data/methodology_graph",
-        embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
+        embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2",
+        embedding_dtype: str = "float32"
     ):
+        """
+        Args:
+            storage_dir: 存储目录
+            embedding_model: 嵌入模型名称
+            embedding_dtype: 内存中节点嵌入矩阵的精度（float32 / int8），
+                int8 内存减为1/4，相似度误差约 1e-3；float32 模式下从磁盘加载的
+                float16矩阵直接以内存映射方式使用，打分时分块转换
+        """
+        if embedding_dtype not in EMBEDDING_MATRIX_DTYPES:
+            raise ValueError(f"不支持的嵌入矩阵精度: {embedding_dtype}，可选: {EMBEDDING_MATRIX_DTYPES}")
+        self.embedding_dtype = embedding_dtype
+
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         # 图结构
         self.nodes: Dict[str, VariableNode] = {}  # node_id -> VariableNode
         self.edges: List[MethodEdge] = []
-        self.adjacency: Dict[str, Set[str]] = defaultdict(set)  # node_id -> neighbor_ids
-        self.reverse_adjacency: Dict[str, Set[str]] = defaultdict(set)  # node_id -> nodes pointing to it
+        # 邻接关系由 edges 压缩为CSR，节点或边变化后置为None按需重建
+        self._adjacency: Optional[_CSRAdjacency] = None
 
         # 索引
         self.name_to_id: Dict[str, str] = {}  # normalized_name -> node_id
         self.method_index: Dict[str, List[int]] = defaultdict(list)  # method -> edge indices
-
-        # 嵌入模型
-        self.embedding_model = None
+        self._edge_ids: Set[str] = set()  # 已有边的ID，用于去重
+        self._edges_by_source: Dict[str, List[int]] = defaultdict(list)  # source_id -> edge indices
+        self._edges_by_target: Dict[str, List[int]] = defaultdict(list)  # target_id -> edge indices
+        self._method_freq_cache: Optional[List[Tuple[str, int]]] = None  # 频次最高的10个方法，加边后失效
+        self._name_lower: Optional[Dict[str, str]] = None  # node_id -> 小写名称，新增节点后失效
+
+        # 节点/边ID的哈希方案：新图谱使用BLAKE2b，已有图谱保持MD5，保证增量构建时ID一致
+        self._id_scheme = "blake2b"
+
+        # 归一化后的节点嵌入矩阵（行顺序与 _embedding_ids 一致），嵌入变化后置为None按需重建
+        self._embedding_matrix: Optional[np.ndarray] = None
+        self._embedding_ids: List[str] = []
+
+        # 嵌入模型（首次访问 embedding_model 时才加载，只做统计或关键词检索时不加载）
+        self._embedding_model = None
+        self._embedding_model_loaded = False
         self.embedding_model_name = embedding_model
-        if EMBEDDINGS_AVAILABLE:
-            try:
-                self.embedding_model = SentenceTransformer(embedding_model)
-                logger.info(f"嵌入模型加载成功: {embedding_model}")
-            except Exception as e:
-                logger.warning(f"嵌入模型加载失败: {e}")
 
         # 尝试加载已有图谱
         self._load_graph()
 
+    @property
+    def embedding_model(self) -> Optional["SentenceTransformer"]:
+        """嵌入模型（延迟加载，不可用或加载失败时为None）"""
+        if not self._embedding_model_loaded:
+            self._embedding_model_loaded = True
+            if EMBEDDINGS_AVAILABLE:
+                try:
+                    model = SentenceTransformer(self.embedding_model_name)
+                    if model.device.type == "cuda":
+                        # GPU上使用fp16推理，显存占用和带宽减半
+                        model.half()
+                    self._embedding_model = model
+                    logger.info(f"嵌入模型加载成功: {self.embedding_model_name} (设备: {model.device})")
+                except Exception as e:
+                    logger.warning(f"嵌入模型加载失败: {e}")
+        return self._embedding_model
+
+    @embedding_model.setter
+    def embedding_model(self, model: Optional["SentenceTransformer"]):
+        self._embedding_model = model
+        self._embedding_model_loaded = True
+
     def _normalize_variable_name(self, name: str) -> str:
         """标准化变量名称"""
         if not name or not isinstance(name, str):
             return ""
-        # 去除空白、括号内容，转小写
-        name = name.strip()
-        name = re.sub(r'[（(].*?[）)]', '', name)  # 移除括号及其内容
-        name = re.sub(r'\s+', '', name)  # 移除空白
-        return name.lower()
-
-    def _generate_node_id(self, name: str) -> str:
-        """生成节点ID"""
-        normalized = self._normalize_variable_name(name)
-        return hashlib.md5(normalized.encode()).hexdigest()[:12]
+        return _normalize_name(name)
+
+    def _hash_id(self, content: str) -> str:
+        """按图谱的哈希方案生成12位十六进制ID"""
+        data = content.encode()
+        if self._id_scheme == "blake2b":
+            return hashlib.blake2b(data, digest_size=6).hexdigest()
+        return hashlib.md5(data).hexdigest()[:12]
+
+    def _generate_node_id(self, normalized: str) -> str:
+        """由标准化后的变量名生成节点ID"""
+        return self._hash_id(normalized)
 
     def _generate_edge_id(self, source_id: str, target_id: str, method: str, paper: str) -> str:
         """生成边ID"""
-        content = f"{source_id}_{target_id}_{method}_{paper}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        return self._hash_id(f"{source_id}_{target_id}_{method}_{paper}")
 
     def _parse_variables(self, text: str) -> List[str]:
         """解析变量文本，可能包含多个变量（用逗号、顿号等分隔）"""
         if not text or not isinstance(text, str) or text.strip() in ['', 'N/A', '不适用', '未提及']:
             return []
 
-        # 分隔符
-        separators = r'[,，、;；\n]'
-        parts = re.split(separators, text)
+        # 按逗号、顿号、分号、换行分隔
+        parts = _SEP_RE.split(text)
 
         variables = []
         for part in parts:
@@ -171,8 +322,7 @@ class MethodologyKnowledgeGraph:
         if not text or not isinstance(text, str):
             return []
 
-        separators = r'[,，、;；\n]'
-        parts = re.split(separators, text)
+        parts = _SEP_RE.split(text)
 
         methods = []
         for part in parts:
@@ -197,24 +347,41 @@ class MethodologyKnowledgeGraph:
 
         stats = {"papers": 0, "nodes": 0, "edges": 0, "skipped": 0}
 
+        # UTF-8 用 utf-8-sig 读取：有BOM时自动去掉，没有时等同utf-8，无需预先打开文件检测
+        if codecs.lookup(encoding).name == 'utf-8':
+            encoding = 'utf-8-sig'
+
         # 读取CSV
         try:
-            with open(csv_path, 'r', encoding=encoding) as f:
-                # 尝试检测BOM
-                first_line = f.readline()
-                f.seek(0)
-                if first_line.startswith('\ufeff'):
-                    encoding = 'utf-8-sig'
-
-            with open(csv_path, 'r', encoding=encoding) as f:
-                reader = csv.DictReader(f)
+            with open(csv_path, 'r', encoding=encoding, newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+
+                # 表头只解析一次：每个字段取中文列名，缺失时回退到英文列名
+                column_index = {name: idx for idx, name in enumerate(header)}
+
+                def resolve(*names: str) -> Optional[int]:
+                    for name in names:
+                        if name in column_index:
+                            return column_index[name]
+                    return None
+
+                columns = (
+                    resolve('文章名称', 'title'),
+                    resolve('核心研究问题', 'research_question'),
+                    resolve('X (自变量)', 'X'),
+                    resolve('Y (因变量)', 'Y'),
+                    resolve('计量模型 (方法)', 'method'),
+                )
 
                 for row in reader:
-                    paper_title = row.get('文章名称', row.get('title', '')).strip()
-                    research_question = row.get('核心研究问题', row.get('research_question', '')).strip()
-                    x_text = row.get('X (自变量)', row.get('X', '')).strip()
-                    y_text = row.get('Y (因变量)', row.get('Y', '')).strip()
-                    method_text = row.get('计量模型 (方法)', row.get('method', '')).strip()
+                    if not row:
+                        continue  # 与DictReader一致，跳过空行
+                    row_len = len(row)
+                    paper_title, research_question, x_text, y_text, method_text = (
+                        row[col].strip() if col is not None and col < row_len else ''
+                        for col in columns
+                    )
 
                     # 解析变量
                     x_vars = self._parse_variables(x_text)
@@ -227,16 +394,15 @@ class MethodologyKnowledgeGraph:
 
                     stats["papers"] += 1
 
-                    # 添加节点和边
+                    # 每篇论文的X/Y节点各只添加一次（节点创建顺序与逐对添加时一致），再批量添加边
+                    x_ids = []
+                    y_ids = []
                     for x_var in x_vars:
-                        x_node = self._add_or_update_node(x_var, "X", paper_title)
-
-                        for y_var in y_vars:
-                            y_node = self._add_or_update_node(y_var, "Y", paper_title)
+                        x_ids.append(self._add_or_update_node(x_var, "X", paper_title).id)
+                        if not y_ids:
+                            y_ids = [self._add_or_update_node(y_var, "Y", paper_title).id for y_var in y_vars]
 
-                            for method in methods:
-                                self._add_edge(x_node.id, y_node.id, method, paper_title, research_question)
-                                stats["edges"] += 1
+                    stats["edges"] += self._add_edges_bulk(x_ids, y_ids, methods, paper_title, research_question)
 
         except Exception as e:
             logger.error(f"读取CSV失败: {e}")
@@ -268,7 +434,7 @@ class MethodologyKnowledgeGraph:
             return node
 
         # 创建新节点
-        node_id = self._generate_node_id(name)
+        node_id = self._generate_node_id(normalized)
         node = VariableNode(
             id=node_id,
             name=name,
@@ -279,6 +445,8 @@ class MethodologyKnowledgeGraph:
 
         self.nodes[node_id] = node
         self.name_to_id[normalized] = node_id
+        self._name_lower = None
+        self._adjacency = None
 
         return node
 
@@ -287,9 +455,9 @@ class MethodologyKnowledgeGraph:
         edge_id = self._generate_edge_id(source_id, target_id, method, paper)
 
         # 检查是否已存在
-        for edge in self.edges:
-            if edge.id == edge_id:
-                return
+        if edge_id in self._edge_ids:
+            return
+        self._edge_ids.add(edge_id)
 
         edge = MethodEdge(
             id=edge_id,
@@ -303,12 +471,40 @@ class MethodologyKnowledgeGraph:
         edge_idx = len(self.edges)
         self.edges.append(edge)
 
-        # 更新邻接表
-        self.adjacency[source_id].add(target_id)
-        self.reverse_adjacency[target_id].add(source_id)
-
-        # 更新方法索引
+        # 更新方法索引和端点索引
         self.method_index[method].append(edge_idx)
+        self._edges_by_source[source_id].append(edge_idx)
+        self._edges_by_target[target_id].append(edge_idx)
+        self._method_freq_cache = None
+        self._adjacency = None
+
+    def _add_edges_bulk(
+        self,
+        source_ids: List[str],
+        target_ids: List[str],
+        methods: List[str],
+        paper: str,
+        research_question: str
+    ) -> int:
+        """
+        添加一篇论文的全部 X × Y × 方法 边
+
+        Args:
+            source_ids: X节点ID列表
+            target_ids: Y节点ID列表
+            methods: 方法列表
+            paper: 论文标题
+            research_question: 研究问题
+
+        Returns:
+            处理的边数（包括已存在的边）
+        """
+        add_edge = self._add_edge
+        count = 0
+        for source_id, target_id, method in itertools.product(source_ids, target_ids, methods):
+            add_edge(source_id, target_id, method, paper, research_question)
+            count += 1
+        return count
 
     def _compute_embeddings(self):
         """计算所有节点的嵌入向量"""
@@ -318,10 +514,17 @@ class MethodologyKnowledgeGraph:
         logger.info("正在计算节点嵌入向量...")
 
         names = [node.name for node in self.nodes.values()]
-        embeddings = self.embedding_model.encode(names, show_progress_bar=True)
+        embeddings = self.embedding_model.encode(
+            names,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=True
+        )
 
-        for node, emb in zip(self.nodes.values(), embeddings):
-            node.embedding = emb.tolist()
+        for node in self.nodes.values():
+            node.embedding = None
+        self._set_embedding_matrix(np.asarray(embeddings, dtype=np.float32), list(self.nodes))
 
         logger.info(f"完成 {len(self.nodes)} 个节点的嵌入计算")
 
@@ -331,6 +534,7 @@ class MethodologyKnowledgeGraph:
             "nodes": {nid: node.to_dict() for nid, node in self.nodes.items()},
             "edges": [edge.to_dict() for edge in self.edges],
             "name_to_id": self.name_to_id,
+            "id_scheme": self._id_scheme,
             "stats": {
                 "node_count": len(self.nodes),
                 "edge_count": len(self.edges),
@@ -340,14 +544,22 @@ class MethodologyKnowledgeGraph:
         }
 
         # 保存主数据
-        with open(self.storage_dir / "graph.json", 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, ensure_ascii=False, indent=2)
-
-        # 保存嵌入向量（单独文件，可能较大）
-        if any(node.embedding for node in self.nodes.values()):
-            embeddings = {nid: node.embedding for nid, node in self.nodes.items() if node.embedding}
-            with open(self.storage_dir / "embeddings.json", 'w', encoding='utf-8') as f:
-                json.dump(embeddings, f)
+        (self.storage_dir / "graph.json").write_bytes(_json_dumps(graph_data))
+
+        # 保存嵌入向量（float16二进制矩阵 + 行ID列表）
+        matrix, ids = self._get_embedding_matrix()
+        if ids:
+            if matrix.dtype == np.int8:
+                matrix = matrix.astype(np.float32) / INT8_SCALE
+            # 先写临时文件再替换：当前矩阵可能正是该文件的内存映射，直接覆盖写会破坏映射
+            matrix_file = self.storage_dir / EMBEDDING_MATRIX_FILE
+            tmp_file = matrix_file.with_suffix(".npy.tmp")
+            with open(tmp_file, "wb") as f:
+                np.save(f, matrix.astype(np.float16))
+            os.replace(tmp_file, matrix_file)
+            (self.storage_dir / EMBEDDING_IDS_FILE).write_bytes(_json_dumps(ids))
+            # 旧版JSON嵌入已被矩阵取代
+            (self.storage_dir / LEGACY_EMBEDDING_FILE).unlink(missing_ok=True)
 
         logger.info(f"图谱已保存到 {self.storage_dir}")
 
@@ -359,8 +571,9 @@ class MethodologyKnowledgeGraph:
             return
 
         try:
-            with open(graph_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _json_loads(graph_file.read_bytes())
+            # 未记录哈希方案的旧图谱使用MD5
+            self._id_scheme = data.get("id_scheme", "md5")
 
             # 恢复节点
             for nid, node_data in data.get("nodes", {}).items():
@@ -371,32 +584,115 @@ class MethodologyKnowledgeGraph:
                     roles=set(node_data["roles"]),
                     papers=node_data["papers"]
                 )
+            self._name_lower = None
 
             # 恢复边
             for edge_data in data.get("edges", []):
                 edge = MethodEdge(**edge_data)
                 self.edges.append(edge)
-                self.adjacency[edge.source_id].add(edge.target_id)
-                self.reverse_adjacency[edge.target_id].add(edge.source_id)
-                self.method_index[edge.method].append(len(self.edges) - 1)
+                self._edge_ids.add(edge.id)
+                edge_idx = len(self.edges) - 1
+                self.method_index[edge.method].append(edge_idx)
+                self._edges_by_source[edge.source_id].append(edge_idx)
+                self._edges_by_target[edge.target_id].append(edge_idx)
 
             # 恢复索引
             self.name_to_id = data.get("name_to_id", {})
 
-            # 加载嵌入
-            emb_file = self.storage_dir / "embeddings.json"
-            if emb_file.exists():
-                with open(emb_file, 'r', encoding='utf-8') as f:
-                    embeddings = json.load(f)
+            # 加载嵌入：优先内存映射二进制矩阵，兼容旧版JSON
+            matrix_file = self.storage_dir / EMBEDDING_MATRIX_FILE
+            emb_file = self.storage_dir / LEGACY_EMBEDDING_FILE
+            if matrix_file.exists():
+                ids = _json_loads((self.storage_dir / EMBEDDING_IDS_FILE).read_bytes())
+                matrix = np.load(matrix_file, mmap_mode='r')
+                rows = [i for i, nid in enumerate(ids) if nid in self.nodes]
+                if len(rows) < len(ids):
+                    matrix = matrix[rows]
+                    ids = [ids[i] for i in rows]
+                # 保存的矩阵已按行归一化：float32模式直接保留float16内存映射，
+                # 不整体转换为float32（否则映射带来的内存节省全部抵消）
+                if self.embedding_dtype == "int8":
+                    matrix = self._quantize_int8(matrix)
+                self._embedding_matrix = matrix
+                self._embedding_ids = ids
+            elif emb_file.exists():
+                embeddings = _json_loads(emb_file.read_bytes())
                 for nid, emb in embeddings.items():
                     if nid in self.nodes:
                         self.nodes[nid].embedding = emb
+                self._embedding_matrix = None
 
             logger.info(f"已加载图谱: {len(self.nodes)} 节点, {len(self.edges)} 边")
 
         except Exception as e:
             logger.error(f"加载图谱失败: {e}")
 
+    def _set_embedding_matrix(self, matrix: np.ndarray, ids: List[str]):
+        """
+        设置节点嵌入矩阵（原地按行L2归一化，embedding_dtype 为 int8 时再量化）
+
+        Args:
+            matrix: 形状为 (N, D) 的float32矩阵
+            ids: 每行对应的节点ID
+        """
+        if len(ids):
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+        if self.embedding_dtype == "int8":
+            matrix = self._quantize_int8(matrix)
+        self._embedding_matrix = matrix
+        self._embedding_ids = ids
+
+    @staticmethod
+    def _quantize_int8(matrix: np.ndarray) -> np.ndarray:
+        """将按行归一化的矩阵分块量化为int8（float16内存映射也按块读取）"""
+        quantized = np.empty(matrix.shape, dtype=np.int8)
+        for start in range(0, len(matrix), SCORE_BLOCK_ROWS):
+            block = matrix[start:start + SCORE_BLOCK_ROWS].astype(np.float32)
+            quantized[start:start + len(block)] = np.round(block * INT8_SCALE)
+        return quantized
+
+    def _get_embedding_matrix(self) -> Tuple[np.ndarray, List[str]]:
+        """
+        获取按行L2归一化的节点嵌入矩阵（只有旧版JSON嵌入时由节点向量构建）
+
+        Returns:
+            (形状为 (N, D) 的float32、float16（磁盘内存映射）或int8矩阵, 每行对应的节点ID列表)
+        """
+        if self._embedding_matrix is None:
+            ids = [nid for nid, node in self.nodes.items() if node.embedding]
+            if ids:
+                matrix = np.asarray([self.nodes[nid].embedding for nid in ids], dtype=np.float32)
+            else:
+                matrix = np.empty((0, 0), dtype=np.float32)
+            self._set_embedding_matrix(matrix, ids)
+        return self._embedding_matrix, self._embedding_ids
+
+    def _score_embeddings(self, matrix: np.ndarray, query_emb: np.ndarray) -> np.ndarray:
+        """
+        计算归一化查询向量与所有节点的余弦相似度
+
+        Args:
+            matrix: 节点嵌入矩阵（float32、float16内存映射或 int8）
+            query_emb: 归一化的float32查询向量
+
+        Returns:
+            每行节点的相似度
+        """
+        if matrix.dtype == np.float32:
+            # 一次矩阵-向量乘法得到与所有节点的余弦相似度
+            return matrix @ query_emb
+
+        # int8/float16矩阵分块转为float32后仍走BLAS（NumPy的整数和半精度矩阵乘法不使用BLAS）
+        scores = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), SCORE_BLOCK_ROWS):
+            block = matrix[start:start + SCORE_BLOCK_ROWS]
+            np.matmul(block.astype(np.float32), query_emb, out=scores[start:start + len(block)])
+        if matrix.dtype == np.int8:
+            scores /= INT8_SCALE
+        return scores
+
     def search_similar_nodes(
         self,
         query: str,
@@ -418,40 +714,88 @@ class MethodologyKnowledgeGraph:
             # 降级为关键词匹配
             return self._keyword_search(query, top_k)
 
+        matrix, ids = self._get_embedding_matrix()
+        if not ids or top_k <= 0:
+            return []
+
         # 计算查询向量
-        query_emb = self.embedding_model.encode([query])[0]
+        query_emb = np.asarray(self.embedding_model.encode([query])[0], dtype=np.float32)
+        query_norm = np.linalg.norm(query_emb)
+        if query_norm == 0:
+            return []
 
-        # 计算相似度
-        results = []
-        for node in self.nodes.values():
-            if node.embedding:
-                node_emb = np.array(node.embedding)
-                similarity = np.dot(query_emb, node_emb) / (
-                    np.linalg.norm(query_emb) * np.linalg.norm(node_emb)
-                )
-                if similarity >= threshold:
-                    results.append((node, float(similarity)))
+        scores = self._score_embeddings(matrix, query_emb / query_norm)
 
-        # 排序并返回
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        # 只对前top_k个候选排序
+        if top_k < len(scores):
+            top_idx = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top_idx = np.arange(len(scores))
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+
+        return [
+            (self.nodes[ids[i]], float(scores[i]))
+            for i in top_idx
+            if scores[i] >= threshold
+        ]
 
     def _keyword_search(self, query: str, top_k: int) -> List[Tuple[VariableNode, float]]:
-        """关键词搜索（降级方案）"""
+        """关键词搜索（降级方案，结果按节点添加顺序，凑满top_k即停止）"""
+        if self._name_lower is None:
+            self._name_lower = {nid: node.name.lower() for nid, node in self.nodes.items()}
+
         query_lower = query.lower()
-        results = []
+        tokens = query_lower.split()
 
-        for node in self.nodes.values():
-            if query_lower in node.name.lower() or query_lower in node.normalized_name:
+        # 多个词时用Aho-Corasick自动机一次扫描名称，同时匹配所有词
+        automaton = None
+        if AHOCORASICK_AVAILABLE and len(tokens) > 1:
+            automaton = ahocorasick.Automaton()
+            for token in tokens:
+                automaton.add_word(token, token)
+            automaton.make_automaton()
+
+        results = []
+        for nid, name_lower in self._name_lower.items():
+            node = self.nodes[nid]
+            if query_lower in name_lower or query_lower in node.normalized_name:
                 results.append((node, 1.0))
-            elif any(q in node.name.lower() for q in query_lower.split()):
+            elif automaton is not None:
+                if next(automaton.iter(name_lower), None) is not None:
+                    results.append((node, 0.5))
+            elif any(token in name_lower for token in tokens):
                 results.append((node, 0.5))
+            if len(results) >= top_k:
+                break
 
         return results[:top_k]
 
+    def _compact_adjacency(self) -> _CSRAdjacency:
+        """由边列表构建正向和反向CSR邻接表（图谱构建或加载后首次查询时调用）"""
+        row_ids = list(self.nodes)
+        rows = {nid: row for row, nid in enumerate(row_ids)}
+        for edge in self.edges:
+            for nid in (edge.source_id, edge.target_id):
+                if nid not in rows:
+                    rows[nid] = len(row_ids)
+                    row_ids.append(nid)
+
+        n = len(row_ids)
+        sources = np.fromiter((rows[e.source_id] for e in self.edges), dtype=np.int64, count=len(self.edges))
+        targets = np.fromiter((rows[e.target_id] for e in self.edges), dtype=np.int64, count=len(self.edges))
+
+        # 同一对X->Y可能对应多条方法边，邻接关系只保留一条
+        pairs = np.unique(sources * n + targets)
+        sources, targets = pairs // n, pairs % n
+
+        out_indptr, out_indices = _build_csr(sources, targets, n)
+        in_indptr, in_indices = _build_csr(targets, sources, n)
+        self._adjacency = _CSRAdjacency(row_ids, rows, out_indptr, out_indices, in_indptr, in_indices)
+        return self._adjacency
+
     def get_neighbors(self, node_id: str, k_hops: int = 1) -> Set[str]:
         """
-        获取K跳邻居节点
+        获取K跳邻居节点（在CSR邻接表上逐层扩展，用布尔数组记录已访问节点）
 
         Args:
             node_id: 起始节点ID
@@ -460,31 +804,40 @@ class MethodologyKnowledgeGraph:
         Returns:
             邻居节点ID集合
         """
-        visited = {node_id}
-        current_level = {node_id}
+        adjacency = self._adjacency or self._compact_adjacency()
+        start = adjacency.rows.get(node_id)
+        if start is None:
+            return set()
+
+        visited = np.zeros(len(adjacency.row_ids), dtype=bool)
+        visited[start] = True
+        current_level = np.array([start], dtype=np.int64)
 
         for _ in range(k_hops):
-            next_level = set()
-            for nid in current_level:
+            if current_level.size == 0:
+                break
+            next_level = np.unique(np.concatenate((
                 # 正向邻居（该节点作为X指向的Y）
-                next_level.update(self.adjacency.get(nid, set()))
+                _csr_neighbors(adjacency.out_indptr, adjacency.out_indices, current_level),
                 # 反向邻居（指向该节点的X）
-                next_level.update(self.reverse_adjacency.get(nid, set()))
-
-            next_level -= visited
-            visited.update(next_level)
+                _csr_neighbors(adjacency.in_indptr, adjacency.in_indices, current_level),
+            )))
+            next_level = next_level[~visited[next_level]]
+            visited[next_level] = True
             current_level = next_level
 
-        visited.discard(node_id)  # 移除起始节点
-        return visited
+        visited[start] = False  # 移除起始节点
+        return {adjacency.row_ids[row] for row in np.flatnonzero(visited)}
 
     def get_edges_between(self, node_ids: Set[str]) -> List[MethodEdge]:
-        """获取节点集合之间的所有边"""
-        result = []
-        for edge in self.edges:
-            if edge.source_id in node_ids and edge.target_id in node_ids:
-                result.append(edge)
-        return result
+        """获取节点集合之间的所有边（只遍历以集合内节点为起点的边，按添加顺序返回）"""
+        edge_indices = []
+        for source_id in node_ids:
+            for edge_idx in self._edges_by_source.get(source_id, ()):
+                if self.edges[edge_idx].target_id in node_ids:
+                    edge_indices.append(edge_idx)
+        edge_indices.sort()
+        return [self.edges[edge_idx] for edge_idx in edge_indices]
 
     def retrieve_subgraph(
         self,
@@ -551,8 +904,8 @@ class MethodologyKnowledgeGraph:
         edges = [edge.to_dict() for edge in related_edges]
 
         # 收集方法和论文
-        methods = list(set(edge.method for edge in related_edges))
-        papers = list(set(edge.paper_title for edge in related_edges))
+        methods = list(dict.fromkeys(edge.method for edge in related_edges))
+        papers = list(dict.fromkeys(edge.paper_title for edge in related_edges))
 
         return SubgraphResult(
             query_nodes=query_nodes,
@@ -586,7 +939,8 @@ class MethodologyKnowledgeGraph:
 
         # 排序
         recommendations = []
-        for method, count in sorted(method_count.items(), key=lambda x: -x[1])[:top_k]:
+        # 只取频次最高的top_k个，不对全部方法排序（同频次保持出现顺序）
+        for method, count in heapq.nlargest(top_k, method_count.items(), key=lambda x: x[1]):
             recommendations.append({
                 "method": method,
                 "frequency": count,
@@ -597,33 +951,41 @@ class MethodologyKnowledgeGraph:
 
     def get_statistics(self) -> Dict[str, Any]:
         """获取图谱统计信息"""
-        # 计算度分布
-        out_degrees = [len(self.adjacency.get(nid, set())) for nid in self.nodes]
-        in_degrees = [len(self.reverse_adjacency.get(nid, set())) for nid in self.nodes]
-
-        # 统计变量角色
-        x_only = sum(1 for n in self.nodes.values() if n.roles == {"X"})
-        y_only = sum(1 for n in self.nodes.values() if n.roles == {"Y"})
-        both = sum(1 for n in self.nodes.values() if "X" in n.roles and "Y" in n.roles)
+        node_count = len(self.nodes)
+
+        # 计算度分布（CSR中前 node_count 行即为各节点，度数为相邻行偏移之差）
+        adjacency = self._adjacency or self._compact_adjacency()
+        out_degrees = np.diff(adjacency.out_indptr[:node_count + 1])
+        in_degrees = np.diff(adjacency.in_indptr[:node_count + 1])
+
+        # 统计变量角色：一次遍历得到角色位图（1=X, 2=Y），再按位图取值计数
+        role_bits = np.fromiter(
+            (("X" in n.roles) | (("Y" in n.roles) << 1) for n in self.nodes.values()),
+            dtype=np.uint8,
+            count=node_count
+        )
+        role_counts = np.bincount(role_bits, minlength=4)
 
         # 方法统计
-        method_freq = {m: len(edges) for m, edges in self.method_index.items()}
-        top_methods = sorted(method_freq.items(), key=lambda x: -x[1])[:10]
+        if self._method_freq_cache is None:
+            method_freq = {m: len(edges) for m, edges in self.method_index.items()}
+            self._method_freq_cache = heapq.nlargest(10, method_freq.items(), key=lambda x: x[1])
+        top_methods = list(self._method_freq_cache)
 
         return {
             "total_nodes": len(self.nodes),
             "total_edges": len(self.edges),
             "unique_methods": len(self.method_index),
             "node_roles": {
-                "x_only": x_only,
-                "y_only": y_only,
-                "both_x_and_y": both
+                "x_only": int(role_counts[1]),
+                "y_only": int(role_counts[2]),
+                "both_x_and_y": int(role_counts[3])
             },
             "degree_stats": {
-                "avg_out_degree": sum(out_degrees) / len(out_degrees) if out_degrees else 0,
-                "max_out_degree": max(out_degrees) if out_degrees else 0,
-                "avg_in_degree": sum(in_degrees) / len(in_degrees) if in_degrees else 0,
-                "max_in_degree": max(in_degrees) if in_degrees else 0,
+                "avg_out_degree": float(out_degrees.mean()) if node_count else 0,
+                "max_out_degree": int(out_degrees.max()) if node_count else 0,
+                "avg_in_degree": float(in_degrees.mean()) if node_count else 0,
+                "max_in_degree": int(in_degrees.max()) if node_count else 0,
             },
             "top_methods": top_methods
         }
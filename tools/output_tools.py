@@ -1,12 +1,61 @@
 """
 工具模块 - 输出格式化工具
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import io
 import json
+import re
+import string
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码、缩进2格的JSON字节（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _json_loads(data: str) -> Any:
+    """解析JSON文本（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# LaTeX文档模板（模块加载时编译一次，单次扫描完成替换）
+_LATEX_TEMPLATE = string.Template(r"""
+\documentclass[12pt,a4paper]{article}
+\usepackage[utf8]{inputenc}
+\usepackage{ctex}
+\usepackage{amsmath}
+\usepackage{booktabs}
+\usepackage{graphicx}
+\usepackage{hyperref}
+
+\title{$title}
+\date{\today}
+
+\begin{document}
+
+\maketitle
+
+$content
+
+\end{document}
+""")
+
+# 可选的 ```json 开头标记与 ``` 结尾标记，捕获中间的JSON正文
+_JSON_FENCE_RE = re.compile(r"(?:```json)?(.*?)(?:```)?", re.DOTALL)
+
 
 class OutputFormatter:
     """
@@ -14,41 +63,42 @@ class OutputFormatter:
     """
     
     @staticmethod
-    def format_to_markdown(content: Dict[str, Any], title: str = "研究报告") -> str:
+    def format_to_markdown(
+        content: Dict[str, Any],
+        title: str = "研究报告",
+        timestamp: Optional[datetime] = None
+    ) -> str:
         """
         将内容格式化为Markdown
         
         Args:
             content: 内容字典
             title: 标题
+            timestamp: 生成时间（默认为当前时间）
             
         Returns:
             Markdown格式文本
         """
-        lines = [
-            f"# {title}",
-            "",
-            f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "---",
-            ""
-        ]
-        
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        buf = io.StringIO()
+        buf.write(f"# {title}\n\n生成时间: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n\n---\n")
+
         for key, value in content.items():
-            lines.append(f"## {key}")
-            lines.append("")
-            
+            buf.write(f"\n## {key}\n")
+
             if isinstance(value, dict):
                 for sub_key, sub_value in value.items():
-                    lines.append(f"### {sub_key}")
-                    lines.append("")
-                    lines.append(str(sub_value))
-                    lines.append("")
+                    buf.write(f"\n### {sub_key}\n\n")
+                    buf.write(str(sub_value))
+                    buf.write("\n")
             else:
-                lines.append(str(value))
-                lines.append("")
-        
-        return "\n".join(lines)
+                buf.write("\n")
+                buf.write(str(value))
+                buf.write("\n")
+
+        return buf.getvalue()
     
     @staticmethod
     def format_to_latex(content: str, title: str = "研究报告") -> str:
@@ -62,29 +112,7 @@ class OutputFormatter:
         Returns:
             LaTeX格式文本
         """
-        latex_template = r"""
-\documentclass[12pt,a4paper]{article}
-\usepackage[utf8]{inputenc}
-\usepackage{ctex}
-\usepackage{amsmath}
-\usepackage{booktabs}
-\usepackage{graphicx}
-\usepackage{hyperref}
-
-\title{TITLE}
-\date{\today}
-
-\begin{document}
-
-\maketitle
-
-CONTENT
-
-\end{document}
-"""
-        
-        latex_doc = latex_template.replace("TITLE", title).replace("CONTENT", content)
-        return latex_doc
+        return _LATEX_TEMPLATE.substitute(title=title, content=content)
     
     @staticmethod
     def save_to_file(content: str, filepath: str, format: str = "txt") -> bool:
@@ -106,11 +134,10 @@ CONTENT
             if format == "json":
                 if isinstance(content, str):
                     content = {"content": content}
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(content, f, ensure_ascii=False, indent=2)
+                filepath.write_bytes(_json_dumps(content))
             else:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                # 一次性编码后直接写入字节，绕过 TextIOWrapper 的逐块编码
+                filepath.write_bytes(content.encode('utf-8'))
             
             logger.info(f"内容已保存到: {filepath}")
             return True
@@ -138,12 +165,11 @@ CONTENT
         
         # 添加表头
         if headers:
-            lines.append("| " + " | ".join(str(h) for h in headers) + " |")
-            lines.append("| " + " | ".join("---" for _ in headers) + " |")
+            lines.append("| " + " | ".join(map(str, headers)) + " |")
+            lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
         
         # 添加数据行
-        for row in data:
-            lines.append("| " + " | ".join(str(cell) for cell in row) + " |")
+        lines.extend(["| " + " | ".join(map(str, row)) + " |" for row in data])
         
         return "\n".join(lines)
 
@@ -175,7 +201,8 @@ class ReportGenerator:
             报告文件路径
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
 
             # 构建报告内容
             content = {
@@ -192,30 +219,28 @@ class ReportGenerator:
                 # 获取 LaTeX 内容的多种方式（按优先级）
                 latex_content = None
 
-                # 方法1：从 final_report 直接获取（ReportWriterAgent 已处理）
                 final_report = results.get("final_report", "")
-                if isinstance(final_report, str) and "\\documentclass" in final_report:
-                    latex_content = final_report
-                    logger.debug("从 final_report 直接获取 LaTeX 内容")
-
-                # 方法2：尝试从 final_report 解析 JSON（兼容旧版本）
-                if not latex_content and isinstance(final_report, str):
-                    try:
-                        # 移除可能的 markdown 代码块标记
-                        import json
-                        clean_json = final_report.strip()
-                        if clean_json.startswith("```json"):
-                            clean_json = clean_json[7:]
-                        if clean_json.endswith("```"):
-                            clean_json = clean_json[:-3]
-
-                        # 尝试解析 JSON
-                        report_data = json.loads(clean_json.strip())
-                        latex_content = report_data.get("latex_source")
-                        if latex_content:
-                            logger.debug("从 final_report JSON 中提取 LaTeX 内容")
-                    except:
-                        pass
+                if isinstance(final_report, str):
+                    clean = final_report.strip()
+                    if clean.startswith("\\documentclass"):
+                        # 方法1：final_report 本身就是 LaTeX（ReportWriterAgent 已处理）
+                        latex_content = clean
+                        logger.debug("从 final_report 直接获取 LaTeX 内容")
+                    elif clean.startswith(("{", "```json")):
+                        # 方法2：从 JSON 格式的 final_report 中提取（兼容旧版本）
+                        try:
+                            # 移除可能的 markdown 代码块标记
+                            clean_json = _JSON_FENCE_RE.fullmatch(clean).group(1)
+                            report_data = _json_loads(clean_json.strip())
+                            latex_content = report_data.get("latex_source")
+                            if latex_content:
+                                logger.debug("从 final_report JSON 中提取 LaTeX 内容")
+                        except Exception:
+                            pass
+                    elif "\\documentclass" in clean:
+                        # LaTeX 前带有说明文字，仍按原样保存
+                        latex_content = clean
+                        logger.debug("从 final_report 直接获取 LaTeX 内容")
 
                 # 检查是否成功获取 LaTeX 内容
                 if latex_content and "\\documentclass" in latex_content:
@@ -224,18 +249,18 @@ class ReportGenerator:
                     logger.info(f"LaTeX论文已保存: {filepath}")
                 else:
                     logger.warning("未找到有效的 LaTeX 内容，回退到 markdown 格式")
-                    formatted = OutputFormatter.format_to_markdown(content, research_topic)
+                    formatted = OutputFormatter.format_to_markdown(content, research_topic, now)
                     filepath = self.output_dir / f"report_{timestamp}.md"
                     OutputFormatter.save_to_file(formatted, str(filepath), "md")
             elif format == "markdown":
-                formatted = OutputFormatter.format_to_markdown(content, research_topic)
+                formatted = OutputFormatter.format_to_markdown(content, research_topic, now)
                 filepath = self.output_dir / f"report_{timestamp}.md"
                 OutputFormatter.save_to_file(formatted, str(filepath), "md")
             elif format == "json":
                 filepath = self.output_dir / f"report_{timestamp}.json"
                 OutputFormatter.save_to_file(content, str(filepath), "json")
             else:
-                formatted = json.dumps(content, ensure_ascii=False, indent=2)
+                formatted = _json_dumps(content).decode('utf-8')
                 filepath = self.output_dir / f"report_{timestamp}.txt"
                 OutputFormatter.save_to_file(formatted, str(filepath), "txt")
 
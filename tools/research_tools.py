@@ -1,11 +1,143 @@
 """
 工具模块 - 文献搜索工具
 """
-from typing import List, Dict, Any
-import requests
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Optional, Sequence
+import threading
+import warnings
+import numpy as np
 from loguru import logger
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import arxiv
+    ARXIV_AVAILABLE = True
+except ImportError:
+    ARXIV_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# 全局共享的arXiv客户端：复用HTTP会话（TCP/TLS连接）。
+# arxiv.Client 的请求间隔控制（_last_request_dt）没有加锁，多线程并发调用时会同时发出请求，
+# 因此所有查询都需持有 _ARXIV_LOCK，保证相邻请求之间满足arXiv要求的间隔
+_ARXIV_CLIENT = arxiv.Client() if ARXIV_AVAILABLE else None
+_ARXIV_LOCK = threading.Lock()
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _tied_pairs(sorted_values):
+        """统计已排序数组中取值相同的样本对数"""
+        pairs = 0
+        run = 1
+        for i in range(1, len(sorted_values)):
+            if sorted_values[i] == sorted_values[i - 1]:
+                run += 1
+            else:
+                pairs += run * (run - 1) // 2
+                run = 1
+        return pairs + run * (run - 1) // 2
+
+    @numba.njit(cache=True)
+    def _sort_count_inversions(values):
+        """自底向上归并排序values（原地），返回严格逆序对数"""
+        n = len(values)
+        src = values
+        dst = np.empty_like(values)
+        swaps = 0
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                i, j, k = lo, mid, lo
+                while i < mid and j < hi:
+                    if src[j] < src[i]:
+                        dst[k] = src[j]
+                        swaps += mid - i
+                        j += 1
+                    else:
+                        dst[k] = src[i]
+                        i += 1
+                    k += 1
+                while i < mid:
+                    dst[k] = src[i]
+                    i += 1
+                    k += 1
+                while j < hi:
+                    dst[k] = src[j]
+                    j += 1
+                    k += 1
+            src, dst = dst, src
+            width *= 2
+        if src is not values:
+            values[:] = src
+        return swaps
+
+    @numba.njit(cache=True)
+    def _kendall_tau_b(x, y):
+        """Knight算法计算 Kendall tau-b，O(n log n)，与 scipy.stats.kendalltau 一致"""
+        n = len(x)
+        total = n * (n - 1) // 2
+        # 按 (x, y) 字典序排序：先按y稳定排序，再按x稳定排序
+        perm = np.argsort(y, kind='mergesort')
+        perm = perm[np.argsort(x[perm], kind='mergesort')]
+        xs = x[perm]
+        ys = y[perm]
+
+        x_ties = _tied_pairs(xs)
+        # x、y同时相同的样本对数
+        xy_ties = 0
+        run = 1
+        for i in range(1, n):
+            if xs[i] == xs[i - 1] and ys[i] == ys[i - 1]:
+                run += 1
+            else:
+                xy_ties += run * (run - 1) // 2
+                run = 1
+        xy_ties += run * (run - 1) // 2
+
+        discordant = _sort_count_inversions(ys)
+        y_ties = _tied_pairs(ys)
+
+        if x_ties == total or y_ties == total:
+            return np.nan
+        con_minus_dis = total - x_ties - y_ties + xy_ties - 2 * discordant
+        tau = con_minus_dis / np.sqrt(float(total - x_ties)) / np.sqrt(float(total - y_ties))
+        return min(1.0, max(-1.0, tau))
+
+    @numba.njit(parallel=True, cache=True)
+    def _kendall_matrix(arr, pair_i, pair_j):
+        """
+        计算各列两两之间的 Kendall tau-b 相关系数矩阵
+
+        Args:
+            arr: 二维float64数组 (n_obs, n_cols)，不含缺失值
+            pair_i: 上三角列对的行下标
+            pair_j: 上三角列对的列下标
+
+        Returns:
+            (n_cols, n_cols) 相关系数矩阵，对角线为1
+        """
+        out = np.eye(arr.shape[1])
+        # 按列对并行，列数较少时也能用满多核
+        for p in numba.prange(len(pair_i)):
+            i = pair_i[p]
+            j = pair_j[p]
+            tau = _kendall_tau_b(arr[:, i], arr[:, j])
+            out[i, j] = tau
+            out[j, i] = tau
+        return out
+
 
 class LiteratureSearchTool:
     """
@@ -29,9 +161,11 @@ class LiteratureSearchTool:
         Returns:
             论文列表
         """
+        if not ARXIV_AVAILABLE:
+            logger.error("arXiv搜索失败: 未安装arxiv库")
+            return []
+
         try:
-            import arxiv
-            
             search = arxiv.Search(
                 query=query,
                 max_results=max_results,
@@ -39,15 +173,16 @@ class LiteratureSearchTool:
             )
             
             papers = []
-            for result in search.results():
-                papers.append({
-                    'title': result.title,
-                    'authors': [author.name for author in result.authors],
-                    'abstract': result.summary,
-                    'published': result.published.strftime('%Y-%m-%d'),
-                    'url': result.entry_id,
-                    'pdf_url': result.pdf_url,
-                })
+            with _ARXIV_LOCK:
+                for result in _ARXIV_CLIENT.results(search):
+                    papers.append({
+                        'title': result.title,
+                        'authors': [author.name for author in result.authors],
+                        'abstract': result.summary,
+                        'published': result.published.strftime('%Y-%m-%d'),
+                        'url': result.entry_id,
+                        'pdf_url': result.pdf_url,
+                    })
             
             logger.info(f"从arXiv搜索到 {len(papers)} 篇论文")
             return papers
@@ -87,17 +222,35 @@ class LiteratureSearchTool:
         
         formatted = []
         for i, paper in enumerate(papers, 1):
-            formatted.append(f"\n{i}. {paper.get('title', 'Unknown')}")
-            formatted.append(f"   作者: {', '.join(paper.get('authors', ['Unknown']))}")
-            formatted.append(f"   发表时间: {paper.get('published', 'Unknown')}")
-            formatted.append(f"   链接: {paper.get('url', 'N/A')}")
+            entry = (
+                f"\n{i}. {paper.get('title', 'Unknown')}\n"
+                f"   作者: {', '.join(paper.get('authors', ['Unknown']))}\n"
+                f"   发表时间: {paper.get('published', 'Unknown')}\n"
+                f"   链接: {paper.get('url', 'N/A')}"
+            )
             if 'abstract' in paper:
-                abstract = paper['abstract'][:200] + "..." if len(paper['abstract']) > 200 else paper['abstract']
-                formatted.append(f"   摘要: {abstract}")
+                abstract = paper['abstract']
+                if len(abstract) > 200:
+                    abstract = abstract[:200] + "..."
+                entry += f"\n   摘要: {abstract}"
+            formatted.append(entry)
         
         return "\n".join(formatted)
 
 
+def _numeric_columns(df: Any) -> Any:
+    """
+    获取DataFrame中的数值列（含float32/int32等全部数值类型，不含bool）
+
+    Args:
+        df: 输入DataFrame
+
+    Returns:
+        数值列索引
+    """
+    return df.select_dtypes(include=np.number).columns
+
+
 class DataProcessingTool:
     """
     数据处理工具
@@ -116,9 +269,7 @@ class DataProcessingTool:
             清洗后的数据
         """
         try:
-            import pandas as pd
-            
-            if not isinstance(data, pd.DataFrame):
+            if not PANDAS_AVAILABLE or not isinstance(data, pd.DataFrame):
                 logger.warning("数据不是DataFrame格式，跳过清洗")
                 return data
             
@@ -140,28 +291,44 @@ class DataProcessingTool:
             return data
     
     @staticmethod
-    def winsorize_data(data: Any, limits: tuple = (0.01, 0.01)) -> Any:
+    def winsorize_data(
+        data: Any,
+        limits: tuple = (0.01, 0.01),
+        numeric_cols: Optional[Sequence[str]] = None
+    ) -> Any:
         """
         数据缩尾处理
         
         Args:
             data: 输入数据
             limits: 缩尾比例 (lower, upper)
+            numeric_cols: 需要处理的数值列（默认自动识别，流水线中可复用已计算的列）
             
         Returns:
             处理后的数据
         """
         try:
-            import pandas as pd
-            from scipy.stats.mstats import winsorize
-            
-            if not isinstance(data, pd.DataFrame):
+            if not PANDAS_AVAILABLE or not isinstance(data, pd.DataFrame):
                 logger.warning("数据不是DataFrame格式，跳过缩尾")
                 return data
             
             result = data.copy()
-            for col in result.select_dtypes(include=['float64', 'int64']).columns:
-                result[col] = winsorize(result[col], limits=limits)
+            if numeric_cols is None:
+                numeric_cols = _numeric_columns(result)
+            else:
+                numeric_cols = pd.Index(numeric_cols)
+            if len(numeric_cols) > 0:
+                block = result[numeric_cols]
+                # 一次排序所有数值列（缺失值排在末尾），按 scipy.stats.mstats.winsorize 的
+                # 取整规则取各列上下分位处的次序统计量作为截断值，缺失值不参与计算
+                sorted_arr = np.sort(block.to_numpy(dtype=np.float64), axis=0)
+                counts = block.count().to_numpy()
+                col_idx = np.arange(len(numeric_cols))
+                low_idx = (limits[0] * counts).astype(np.int64)
+                up_idx = counts - (limits[1] * counts).astype(np.int64) - 1
+                lower = pd.Series(sorted_arr[low_idx, col_idx], index=numeric_cols)
+                upper = pd.Series(sorted_arr[up_idx, col_idx], index=numeric_cols)
+                result[numeric_cols] = block.clip(lower=lower, upper=upper, axis=1).astype(block.dtypes.to_dict())
             
             logger.info(f"数据缩尾处理完成，缩尾比例: {limits}")
             return result
@@ -171,26 +338,39 @@ class DataProcessingTool:
             return data
     
     @staticmethod
-    def standardize_data(data: Any) -> Any:
+    def standardize_data(data: Any, numeric_cols: Optional[Sequence[str]] = None) -> Any:
         """
         数据标准化
         
         Args:
             data: 输入数据
+            numeric_cols: 需要处理的数值列（默认自动识别，流水线中可复用已计算的列）
             
         Returns:
             标准化后的数据
         """
         try:
-            import pandas as pd
-            
-            if not isinstance(data, pd.DataFrame):
+            if not PANDAS_AVAILABLE or not isinstance(data, pd.DataFrame):
                 logger.warning("数据不是DataFrame格式，跳过标准化")
                 return data
             
             result = data.copy()
-            numeric_cols = result.select_dtypes(include=['float64', 'int64']).columns
-            result[numeric_cols] = (result[numeric_cols] - result[numeric_cols].mean()) / result[numeric_cols].std()
+            if numeric_cols is None:
+                numeric_cols = _numeric_columns(result)
+            else:
+                numeric_cols = pd.Index(numeric_cols)
+            if len(numeric_cols) > 0:
+                # 在连续的二维数组上原地计算 (x - mean) / std，避免逐步生成中间DataFrame；
+                # 与pandas一致：忽略缺失值、样本标准差(ddof=1)
+                arr = result[numeric_cols].to_numpy(dtype=np.float64, copy=True)
+                with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    mu = np.nanmean(arr, axis=0)
+                    sd = np.nanstd(arr, axis=0, ddof=1)
+                np.subtract(arr, mu, out=arr)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    np.divide(arr, sd, out=arr)
+                result[numeric_cols] = arr
             
             logger.info("数据标准化完成")
             return result
@@ -206,24 +386,32 @@ class StatisticalAnalysisTool:
     """
     
     @staticmethod
-    def descriptive_statistics(data: Any) -> Dict[str, Any]:
+    def descriptive_statistics(data: Any, as_array: bool = False) -> Dict[str, Any]:
         """
         描述性统计
         
         Args:
             data: 输入数据
+            as_array: 为True时以NumPy数组返回统计量（宽表时避免逐个装箱为Python float）
             
         Returns:
-            统计结果
+            统计结果。默认为 {列名: {统计量: 值}}；
+            as_array=True 时为 {"statistics": 统计量名列表, "columns": 列名列表, "values": 二维数组}
         """
         try:
-            import pandas as pd
-            
-            if not isinstance(data, pd.DataFrame):
+            if not PANDAS_AVAILABLE or not isinstance(data, pd.DataFrame):
                 logger.warning("数据不是DataFrame格式，无法进行描述性统计")
                 return {}
             
-            stats = data.describe().to_dict()
+            desc = data.describe()
+            if as_array:
+                stats = {
+                    "statistics": desc.index.tolist(),
+                    "columns": desc.columns.tolist(),
+                    "values": desc.to_numpy(),
+                }
+            else:
+                stats = desc.to_dict()
             logger.info("描述性统计完成")
             return stats
             
@@ -244,13 +432,19 @@ class StatisticalAnalysisTool:
             相关系数矩阵
         """
         try:
-            import pandas as pd
-            
-            if not isinstance(data, pd.DataFrame):
+            if not PANDAS_AVAILABLE or not isinstance(data, pd.DataFrame):
                 logger.warning("数据不是DataFrame格式，无法进行相关性分析")
                 return None
             
-            corr = data.corr(method=method)
+            if (method == "kendall" and NUMBA_AVAILABLE
+                    and all(pd.api.types.is_numeric_dtype(dtype) for dtype in data.dtypes)
+                    and not data.isna().to_numpy().any()):
+                # 无缺失值的纯数值数据：用并行JIT内核（O(n log n) Knight算法）计算，避免pandas逐列对调用kendalltau
+                pair_i, pair_j = np.triu_indices(data.shape[1], k=1)
+                values = _kendall_matrix(data.to_numpy(dtype=np.float64), pair_i, pair_j)
+                corr = pd.DataFrame(values, index=data.columns, columns=data.columns)
+            else:
+                corr = data.corr(method=method)
             logger.info(f"相关性分析完成，方法: {method}")
             return corr
             
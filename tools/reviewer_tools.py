@@ -2,8 +2,10 @@
 审稿人专用工具模块
 提供文献搜索、方法论验证、评审标准查询等功能
 """
+import functools
+import io
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
 
@@ -13,92 +15,98 @@ class ReviewerTools:
     用于支持审稿人获取权威文献、评审标准等信息
     """
 
-    # 顶级期刊列表
+    # 顶级期刊列表（元组，调用方无法修改共享的类常量）
     TOP_JOURNALS = {
-        "economics_cn": ["经济研究", "管理世界", "中国社会科学", "金融研究", "中国工业经济"],
-        "economics_en": ["American Economic Review", "Quarterly Journal of Economics",
-                        "Journal of Political Economy", "Econometrica", "Review of Economic Studies"],
-        "finance": ["Journal of Finance", "Journal of Financial Economics",
-                   "Review of Financial Studies", "Journal of Monetary Economics"],
-        "management": ["Management Science", "Strategic Management Journal",
-                      "Academy of Management Journal", "Organization Science"]
+        "economics_cn": ("经济研究", "管理世界", "中国社会科学", "金融研究", "中国工业经济"),
+        "economics_en": ("American Economic Review", "Quarterly Journal of Economics",
+                        "Journal of Political Economy", "Econometrica", "Review of Economic Studies"),
+        "finance": ("Journal of Finance", "Journal of Financial Economics",
+                   "Review of Financial Studies", "Journal of Monetary Economics"),
+        "management": ("Management Science", "Strategic Management Journal",
+                      "Academy of Management Journal", "Organization Science")
     }
 
-    # 计量经济学方法论标准
+    # 计量经济学方法论标准（假设/检验/文献为元组，只读共享）
     METHODOLOGY_STANDARDS = {
         "DID": {
             "name": "双重差分法 (Difference-in-Differences)",
-            "key_assumptions": [
+            "key_assumptions": (
                 "平行趋势假设 (Parallel Trends)",
                 "无预期效应 (No Anticipation)",
                 "SUTVA假设 (Stable Unit Treatment Value)"
-            ],
-            "robustness_tests": [
+            ),
+            "robustness_tests": (
                 "平行趋势检验",
                 "安慰剂检验 (Placebo Test)",
                 "事件研究法 (Event Study)",
                 "PSM-DID匹配",
                 "更换处理组/控制组"
-            ],
-            "key_references": [
+            ),
+            "key_references": (
                 "Angrist & Pischke (2009). Mostly Harmless Econometrics",
                 "Bertrand et al. (2004). How Much Should We Trust Differences-in-Differences Estimates?",
                 "Callaway & Sant'Anna (2021). Difference-in-Differences with Multiple Time Periods"
-            ]
+            )
         },
         "IV": {
             "name": "工具变量法 (Instrumental Variables)",
-            "key_assumptions": [
+            "key_assumptions": (
                 "相关性假设 (Relevance)",
                 "外生性假设 (Exogeneity/Exclusion Restriction)"
-            ],
-            "robustness_tests": [
+            ),
+            "robustness_tests": (
                 "一阶段F统计量 (>10)",
                 "过度识别检验 (Sargan/Hansen Test)",
                 "弱工具变量检验",
                 "工具变量有效性论证"
-            ],
-            "key_references": [
+            ),
+            "key_references": (
                 "Stock & Yogo (2005). Testing for Weak Instruments",
                 "Angrist & Krueger (2001). Instrumental Variables and the Search for Identification"
-            ]
+            )
         },
         "RDD": {
             "name": "断点回归设计 (Regression Discontinuity Design)",
-            "key_assumptions": [
+            "key_assumptions": (
                 "连续性假设 (Continuity)",
                 "无操纵假设 (No Manipulation)"
-            ],
-            "robustness_tests": [
+            ),
+            "robustness_tests": (
                 "McCrary密度检验",
                 "带宽敏感性分析",
                 "多项式阶数选择",
                 "协变量平衡检验"
-            ],
-            "key_references": [
+            ),
+            "key_references": (
                 "Lee & Lemieux (2010). Regression Discontinuity Designs in Economics",
                 "Cattaneo et al. (2020). A Practical Introduction to Regression Discontinuity Designs"
-            ]
+            )
         },
         "FE": {
             "name": "固定效应模型 (Fixed Effects)",
-            "key_assumptions": [
+            "key_assumptions": (
                 "严格外生性 (Strict Exogeneity)",
                 "无遗漏时变变量"
-            ],
-            "robustness_tests": [
+            ),
+            "robustness_tests": (
                 "Hausman检验",
                 "聚类标准误",
                 "双向固定效应",
                 "高维固定效应"
-            ],
-            "key_references": [
+            ),
+            "key_references": (
                 "Wooldridge (2010). Econometric Analysis of Cross Section and Panel Data",
                 "Abadie et al. (2023). When Should You Adjust Standard Errors for Clustering?"
-            ]
+            )
         }
     }
 
+    # 方法论检索表：(方法键, 小写方法键, 小写方法名称, 标准信息)，类加载时预计算一次
+    _METHOD_INDEX = tuple(
+        (key, key.lower(), info["name"].lower(), info)
+        for key, info in METHODOLOGY_STANDARDS.items()
+    )
+
     # 内生性问题类型
     ENDOGENEITY_TYPES = {
         "omitted_variable": {
@@ -148,28 +156,23 @@ class ReviewerTools:
         Returns:
             文献列表
         """
-        papers = []
+        # 按标题去重，边搜索边合并，保留首次出现的文献
+        unique_papers: Dict[Any, Dict[str, Any]] = {}
 
         if self.literature_search:
+            # 逐个关键词搜索：arXiv要求相邻请求间隔约3秒，并发请求不会更快
             for keyword in keywords[:3]:  # 限制搜索次数
                 try:
                     results = self.literature_search.search_arxiv(
                         keyword,
                         max_results=max_results
                     )
-                    papers.extend(results)
+                    for paper in results:
+                        unique_papers.setdefault(paper.get('title'), paper)
                 except Exception as e:
                     logger.warning(f"搜索关键词 '{keyword}' 失败: {e}")
 
-        # 去重
-        seen_titles = set()
-        unique_papers = []
-        for paper in papers:
-            if paper.get('title') not in seen_titles:
-                seen_titles.add(paper.get('title'))
-                unique_papers.append(paper)
-
-        return unique_papers[:max_results * 2]
+        return list(unique_papers.values())[:max_results * 2]
 
     def get_methodology_standard(self, method: str) -> Dict[str, Any]:
         """
@@ -181,15 +184,22 @@ class ReviewerTools:
         Returns:
             方法论标准信息
         """
+        return self._match_methodology_standard(method)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _match_methodology_standard(method: str) -> Dict[str, Any]:
+        """按方法名称匹配评审标准（结果只依赖类常量，按方法名缓存）"""
         method_upper = method.upper()
-        if method_upper in self.METHODOLOGY_STANDARDS:
-            return self.METHODOLOGY_STANDARDS[method_upper]
+        if method_upper in ReviewerTools.METHODOLOGY_STANDARDS:
+            return ReviewerTools.METHODOLOGY_STANDARDS[method_upper]
 
         # 模糊匹配
-        for key, value in self.METHODOLOGY_STANDARDS.items():
+        method_lower = method.lower()
+        for key, _, name_lower, value in ReviewerTools._METHOD_INDEX:
             if key in method_upper or method_upper in key:
                 return value
-            if method.lower() in value["name"].lower():
+            if method_lower in name_lower:
                 return value
 
         return {"error": f"未找到方法 '{method}' 的评审标准"}
@@ -204,15 +214,22 @@ class ReviewerTools:
         Returns:
             内生性问题分析指南
         """
+        return self._match_endogeneity_type(issue_type)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _match_endogeneity_type(issue_type: Optional[str]) -> Dict[str, Any]:
+        """按类型匹配内生性问题分析指南（结果只依赖类常量，按类型缓存）"""
         if issue_type:
-            for key, value in self.ENDOGENEITY_TYPES.items():
-                if issue_type.lower() in key or issue_type.lower() in value["name"]:
+            issue_lower = issue_type.lower()
+            for key, value in ReviewerTools.ENDOGENEITY_TYPES.items():
+                if issue_lower in key or issue_lower in value["name"]:
                     return value
             return {"error": f"未找到内生性类型: {issue_type}"}
 
-        return self.ENDOGENEITY_TYPES
+        return ReviewerTools.ENDOGENEITY_TYPES
 
-    def get_top_journals(self, field: str = "economics_cn") -> List[str]:
+    def get_top_journals(self, field: str = "economics_cn") -> Tuple[str, ...]:
         """
         获取指定领域的顶级期刊列表
 
@@ -220,7 +237,7 @@ class ReviewerTools:
             field: 领域名称
 
         Returns:
-            期刊列表
+            期刊元组（只读）
         """
         return self.TOP_JOURNALS.get(field, self.TOP_JOURNALS["economics_cn"])
 
@@ -247,13 +264,16 @@ class ReviewerTools:
         strategy_lower = strategy_description.lower()
 
         # 检测使用的方法
-        for method_key, method_info in self.METHODOLOGY_STANDARDS.items():
-            if (method_key.lower() in strategy_lower or
-                method_info["name"].lower() in strategy_lower):
+        for method_key, key_lower, name_lower, method_info in self._METHOD_INDEX:
+            if key_lower in strategy_lower or name_lower in strategy_lower:
                 evaluation["detected_methods"].append(method_key)
                 evaluation["required_tests"].extend(method_info["robustness_tests"])
                 evaluation["references"].extend(method_info["key_references"])
 
+        # 多个方法可能推荐相同的检验/文献，按首次出现顺序去重
+        evaluation["required_tests"] = list(dict.fromkeys(evaluation["required_tests"]))
+        evaluation["references"] = list(dict.fromkeys(evaluation["references"]))
+
         # 生成建议
         if not evaluation["detected_methods"]:
             evaluation["suggestions"].append("未检测到明确的识别策略，建议补充因果识别方法")
@@ -278,6 +298,14 @@ class ReviewerTools:
         Returns:
             审稿检查清单
         """
+        # 复制各项列表，调用方修改清单时不影响缓存模板和类常量
+        checklist = self._review_checklist_template(model_type)
+        return {section: list(items) for section, items in checklist.items()}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _review_checklist_template(model_type: str) -> Dict[str, List[str]]:
+        """构建指定模型类型的审稿检查清单模板（按模型类型缓存，不可直接修改）"""
         checklist = {
             "核心假设检验": [],
             "稳健性检验": [],
@@ -301,7 +329,7 @@ class ReviewerTools:
             ]
         }
 
-        method_info = self.get_methodology_standard(model_type)
+        method_info = ReviewerTools._match_methodology_standard(model_type)
         if "error" not in method_info:
             checklist["核心假设检验"] = method_info.get("key_assumptions", [])
             checklist["稳健性检验"] = method_info.get("robustness_tests", [])
@@ -324,17 +352,17 @@ class ReviewerTools:
         if not papers:
             return "未找到相关参考文献"
 
-        formatted = ["## 相关权威文献参考\n"]
+        buf = io.StringIO()
+        buf.write("## 相关权威文献参考\n")
         for i, paper in enumerate(papers, 1):
-            formatted.append(f"### {i}. {paper.get('title', 'Unknown')}")
-            formatted.append(f"- 作者: {', '.join(paper.get('authors', ['Unknown']))}")
-            formatted.append(f"- 发表时间: {paper.get('published', 'Unknown')}")
+            buf.write(f"\n### {i}. {paper.get('title', 'Unknown')}\n")
+            buf.write(f"- 作者: {', '.join(paper.get('authors', ['Unknown']))}\n")
+            buf.write(f"- 发表时间: {paper.get('published', 'Unknown')}\n")
             if paper.get('abstract'):
                 abstract = paper['abstract'][:300] + "..." if len(paper['abstract']) > 300 else paper['abstract']
-                formatted.append(f"- 摘要: {abstract}")
-            formatted.append("")
+                buf.write(f"- 摘要: {abstract}\n")
 
-        return "\n".join(formatted)
+        return buf.getvalue()
 
 
 # 便捷函数